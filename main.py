@@ -4,7 +4,7 @@ import sys
 import os
 from PySide6.QtWidgets import QApplication, QStyleFactory
 from PySide6.QtCore import QSettings, Qt
-from PySide6.QtGui import QPalette, QColor
+from PySide6.QtGui import QPalette, QColor, QPixmapCache
 
 from src.ui.main_window import MainWindow
 from src.utils.logger import setup_logger
@@ -50,6 +50,9 @@ if __name__ == "__main__":
     # Create Qt application
     app = QApplication(sys.argv)
     
+    # Room in the shared pixmap cache for full-size image previews (in KB)
+    QPixmapCache.setCacheLimit(50 * 1024)
+    
     # Set application style to Fusion for consistent look
     app.setStyle(QStyleFactory.create("Fusion"))
     
@@ -3,8 +3,10 @@
 Constants for the application theme
 """
 
-# Theme colors
-DARK_THEME = {
+from types import MappingProxyType
+
+# Theme colors; read-only so widgets can cache per-theme styles by id(theme)
+DARK_THEME = MappingProxyType({
     "name": "dark",
     "primary": "#121212",          # Background
     "secondary": "#1E1E1E",        # Cards
@@ -37,9 +39,9 @@ DARK_THEME = {
     "disabled": "#666666",         # Disabled element color
     "header_bg": "#1E1E1E",        # Header background
     "footer_bg": "#1E1E1E",        # Footer background
-}
+})
 
-LIGHT_THEME = {
+LIGHT_THEME = MappingProxyType({
     "name": "light",
     "primary": "#FAFAFA",          # Background
     "secondary": "#F0F0F0",        # Cards
@@ -72,7 +74,7 @@ LIGHT_THEME = {
     "disabled": "#CCCCCC",         # Disabled element color
     "header_bg": "#F0F0F0",        # Header background
     "footer_bg": "#F0F0F0",        # Footer background
-}
+})
 
 # Get theme based on name
 def get_theme(name):
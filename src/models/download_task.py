@@ -31,11 +31,16 @@ class DownloadTask:
     
     def get_status_color(self, theme: Dict) -> str:
         """Get the color for the status based on the current theme"""
-        if self.status == DOWNLOAD_STATUS["COMPLETED"]:
+        return self.status_color(self.status, theme)
+    
+    @staticmethod
+    def status_color(status: str, theme: Dict) -> str:
+        """Get the color for a status value based on the given theme"""
+        if status == DOWNLOAD_STATUS["COMPLETED"]:
             return theme["success"]
-        elif self.status == DOWNLOAD_STATUS["FAILED"] or self.status == DOWNLOAD_STATUS["CANCELED"]:
+        elif status == DOWNLOAD_STATUS["FAILED"] or status == DOWNLOAD_STATUS["CANCELED"]:
             return theme["danger"]
-        elif self.status == DOWNLOAD_STATUS["DOWNLOADING"]:
+        elif status == DOWNLOAD_STATUS["DOWNLOADING"]:
             return theme["accent"]
         else:
             return theme["text_secondary"]
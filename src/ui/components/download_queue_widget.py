@@ -1,4 +1,3 @@
-
 from typing import Dict, List, Optional
 
 from PySide6.QtWidgets import (
@@ -8,9 +7,40 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal, QEvent, QMimeData, QPoint
 from PySide6.QtGui import QDrag, QMouseEvent
 
+from src.constants.constants import DOWNLOAD_STATUS
 from src.models.download_task import DownloadTask
 from src.ui.components.download_task_card import DownloadTaskCard
 
+# Statuses counted as pending in the queue header
+ACTIVE_STATUSES = frozenset((DOWNLOAD_STATUS["QUEUED"], DOWNLOAD_STATUS["DOWNLOADING"]))
+
+# Formatted stylesheets per theme, keyed by id(theme) (themes are module-level singletons)
+_SS_CACHE: Dict[int, Dict[str, str]] = {}
+
+
+def _ss(theme: Dict) -> Dict[str, str]:
+    """Get the widget stylesheets for a theme, formatting them only once"""
+    sheets = _SS_CACHE.get(id(theme))
+    if sheets is None:
+        sheets = {
+            "title": f"font-size: 16px; font-weight: bold; color: {theme['text']};",
+            "count": f"color: {theme['text_secondary']};",
+            "clear_btn": f"""
+                QPushButton {{
+                    background-color: {theme['danger']};
+                    color: white;
+                    border: none;
+                    border-radius: 4px;
+                    padding: 4px 8px;
+                }}
+                QPushButton:hover {{
+                    background-color: {theme['danger_hover']};
+                }}
+            """,
+        }
+        _SS_CACHE[id(theme)] = sheets
+    return sheets
+
 class DownloadQueueWidget(QWidget):
     """Widget for displaying the download queue"""
     
@@ -19,47 +49,40 @@ class DownloadQueueWidget(QWidget):
     move_to_top_requested = Signal(str)  # url
     move_up_requested = Signal(str)  # url
     move_down_requested = Signal(str)  # url
+    move_to_position_requested = Signal(str, str)  # url, target url
     
     def __init__(self, theme: Dict, parent=None):
         super().__init__(parent)
         self.theme = theme
         self.task_cards = {}  # url -> DownloadTaskCard
+        self._task_status = {}  # url -> last seen status
+        self._active_count = 0
         self.drag_start_position = None
         self.init_ui()
     
     def init_ui(self):
         """Initialize UI components"""
         layout = QVBoxLayout(self)
+        sheets = _ss(self.theme)
         
         # Title
         title_layout = QHBoxLayout()
-        title = QLabel("Download Queue")
-        title.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {self.theme['text']};")
+        self.title_label = QLabel("Download Queue")
+        self.title_label.setStyleSheet(sheets["title"])
         
         self.queue_count = QLabel("0 items")
-        self.queue_count.setStyleSheet(f"color: {self.theme['text_secondary']};")
+        self.queue_count.setStyleSheet(sheets["count"])
         
-        title_layout.addWidget(title)
+        title_layout.addWidget(self.title_label)
         title_layout.addWidget(self.queue_count)
         title_layout.addStretch()
         
         # Clear button
-        clear_btn = QPushButton("Clear Queue")
-        clear_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['danger']};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 8px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['danger_hover']};
-            }}
-        """)
-        clear_btn.clicked.connect(self.clear_requested.emit)
-        
-        title_layout.addWidget(clear_btn)
+        self.clear_btn = QPushButton("Clear Queue")
+        self.clear_btn.setStyleSheet(sheets["clear_btn"])
+        self.clear_btn.clicked.connect(self.clear_requested.emit)
+        
+        title_layout.addWidget(self.clear_btn)
         
         layout.addLayout(title_layout)
         
@@ -81,36 +104,39 @@ class DownloadQueueWidget(QWidget):
     def set_theme(self, theme):
         """Update the theme"""
         self.theme = theme
+        sheets = _ss(self.theme)
         
-        # Update title and count
-        for child in self.findChildren(QLabel):
-            if "font-size: 16px" in child.styleSheet():
-                child.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {self.theme['text']};")
-            else:
-                child.setStyleSheet(f"color: {self.theme['text_secondary']};")
-        
-        # Update clear button
-        for child in self.findChildren(QPushButton):
-            if "Clear Queue" in child.text():
-                child.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {self.theme['danger']};
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        padding: 4px 8px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {self.theme['danger_hover']};
-                    }}
-                """)
+        # Update title, count and clear button
+        self.title_label.setStyleSheet(sheets["title"])
+        self.queue_count.setStyleSheet(sheets["count"])
+        self.clear_btn.setStyleSheet(sheets["clear_btn"])
         
         # Update task cards
         for card in self.task_cards.values():
             card.set_theme(self.theme)
     
+    def _track_status(self, url: str, status: Optional[str]):
+        """Adjust the active counter when a task changes status (None = removed)"""
+        previous = self._task_status.get(url)
+        if previous == status:
+            return
+        
+        if previous in ACTIVE_STATUSES:
+            self._active_count -= 1
+        if status in ACTIVE_STATUSES:
+            self._active_count += 1
+        
+        if status is None:
+            self._task_status.pop(url, None)
+        else:
+            self._task_status[url] = status
+        
+        self.queue_count.setText(f"{self._active_count} items")
+    
     def update_task(self, task: DownloadTask):
         """Update a task in the queue"""
+        self._track_status(task.url, task.status)
+        
         if task.url in self.task_cards:
             # Update existing card
             self.task_cards[task.url].update_task(task)
@@ -128,20 +154,31 @@ class DownloadQueueWidget(QWidget):
     
     def update_tasks(self, tasks: List[DownloadTask]):
         """Update all tasks"""
-        # Update active task count
-        active_count = sum(1 for task in tasks if task.status in ["queued", "downloading"])
-        self.queue_count.setText(f"{active_count} items")
-        
-        # Update existing cards and add new ones
-        for task in tasks:
-            self.update_task(task)
-        
-        # Remove cards for tasks that no longer exist
-        task_urls = {task.url for task in tasks}
-        for url in list(self.task_cards.keys()):
-            if url not in task_urls:
-                self.task_cards[url].deleteLater()
-                del self.task_cards[url]
+        # Defer layout/paint until the whole batch has been applied
+        self.tasks_widget.setUpdatesEnabled(False)
+        try:
+            # Update existing cards and add new ones
+            for task in tasks:
+                self.update_task(task)
+            
+            # Remove cards for tasks that no longer exist
+            task_urls = {task.url for task in tasks}
+            for url in list(self.task_cards.keys()):
+                if url not in task_urls:
+                    self.task_cards[url].deleteLater()
+                    del self.task_cards[url]
+                    self._track_status(url, None)
+        finally:
+            self.tasks_widget.setUpdatesEnabled(True)
+            self.tasks_widget.update()
+    
+    def _card_at(self, pos: QPoint) -> Optional[DownloadTaskCard]:
+        """Find the card under a position given in tasks_widget coordinates"""
+        # Qt's hit test finds the deepest widget; walk up to the card holding it
+        widget = self.tasks_widget.childAt(pos)
+        while widget is not None and widget.parentWidget() is not self.tasks_widget:
+            widget = widget.parentWidget()
+        return widget if isinstance(widget, DownloadTaskCard) else None
     
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse press events for drag and drop"""
@@ -158,10 +195,9 @@ class DownloadQueueWidget(QWidget):
         if (event.pos() - self.drag_start_position).manhattanLength() < QApplication.startDragDistance():
             return
         
-        # Find the card under the mouse
-        child = self.childAt(self.drag_start_position)
-        while child and not isinstance(child, DownloadTaskCard):
-            child = child.parentWidget()
+        # Find the card under the press position
+        local_pos = self.tasks_widget.mapFrom(self, self.drag_start_position)
+        child = self._card_at(local_pos)
         
         if not child:
             return
@@ -194,14 +230,8 @@ class DownloadQueueWidget(QWidget):
             url = event.mimeData().text()
             
             # Find the card under the drop position
-            target_pos = event.pos()
-            target_card = None
-            
-            for card in self.task_cards.values():
-                card_rect = card.geometry()
-                if card_rect.contains(target_pos):
-                    target_card = card
-                    break
+            target_pos = self.tasks_widget.mapFrom(self, event.pos())
+            target_card = self._card_at(target_pos)
             
             if target_card and target_card.task.url != url:
                 # Emit move signals based on drop position
@@ -12,6 +12,65 @@ from PySide6.QtWidgets import QGraphicsDropShadowEffect
 from src.constants.constants import DOWNLOAD_STATUS
 from src.models.download_task import DownloadTask
 
+# Formatted stylesheets per theme, keyed by id(theme) (themes are module-level singletons)
+_SS_CACHE: Dict[int, Dict[str, str]] = {}
+
+
+def _progress_ss(theme: Dict, chunk_color: str) -> str:
+    """Build a progress bar stylesheet"""
+    return f"""
+        QProgressBar {{
+            border: 1px solid {theme['border']};
+            border-radius: 4px;
+            text-align: center;
+            height: 16px;
+            color: {theme['text']};
+            background-color: {theme['input_bg']};
+        }}
+        QProgressBar::chunk {{
+            background-color: {chunk_color};
+            border-radius: 3px;
+        }}
+    """
+
+
+def _ss(theme: Dict) -> Dict[str, str]:
+    """Get the card stylesheets for a theme, formatting them only once"""
+    sheets = _SS_CACHE.get(id(theme))
+    if sheets is None:
+        sheets = {
+            "card": f"""
+                #downloadTaskCard {{
+                    background-color: {theme["card"]};
+                    border-radius: 8px;
+                    border: 1px solid {theme["border"]};
+                }}
+                #downloadTaskCard:hover {{
+                    border: 1px solid {theme["border_hover"]};
+                    background-color: {theme["card_hover"]};
+                }}
+            """,
+            "url": f"font-weight: bold; color: {theme['text']};",
+            "label": f"color: {theme['text_secondary']};",
+            "model_progress": _progress_ss(theme, theme["accent"]),
+            "image_progress": _progress_ss(theme, theme["success"]),
+            "info": f"color: {theme['text_secondary']}; font-size: 12px;",
+            "cancel_btn": f"""
+                QPushButton {{
+                    background-color: {theme['danger']};
+                    color: white;
+                    border: none;
+                    border-radius: 4px;
+                    padding: 4px 8px;
+                }}
+                QPushButton:hover {{
+                    background-color: {theme['danger_hover']};
+                }}
+            """,
+        }
+        _SS_CACHE[id(theme)] = sheets
+    return sheets
+
 class DownloadTaskCard(QWidget):
     """Widget for displaying a download task in the queue"""
     
@@ -27,6 +86,7 @@ class DownloadTaskCard(QWidget):
         """Initialize UI components"""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
+        sheets = _ss(self.theme)
         
         # Card frame
         self.setObjectName("downloadTaskCard")
@@ -48,7 +108,7 @@ class DownloadTaskCard(QWidget):
             url_text = url_text[:37] + "..."
         url_label = QLabel(url_text)
         url_label.setToolTip(self.task.url)
-        url_label.setStyleSheet(f"font-weight: bold; color: {self.theme['text']};")
+        url_label.setStyleSheet(sheets["url"])
         
         # Status label
         self.status_label = QLabel(self.task.status.capitalize())
@@ -66,27 +126,14 @@ class DownloadTaskCard(QWidget):
         # Model progress
         model_layout = QHBoxLayout()
         model_label = QLabel("Model:")
-        model_label.setStyleSheet(f"color: {self.theme['text_secondary']};")
+        model_label.setStyleSheet(sheets["label"])
         model_label.setFixedWidth(50)
         
         self.model_progress = QProgressBar()
         self.model_progress.setRange(0, 100)
         self.model_progress.setValue(self.task.model_progress)
         self.model_progress.setTextVisible(True)
-        self.model_progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {self.theme['border']};
-                border-radius: 4px;
-                text-align: center;
-                height: 16px;
-                color: {self.theme['text']};
-                background-color: {self.theme['input_bg']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['accent']};
-                border-radius: 3px;
-            }}
-        """)
+        self.model_progress.setStyleSheet(sheets["model_progress"])
         
         model_layout.addWidget(model_label)
         model_layout.addWidget(self.model_progress)
@@ -94,27 +141,14 @@ class DownloadTaskCard(QWidget):
         # Image progress
         image_layout = QHBoxLayout()
         image_label = QLabel("Images:")
-        image_label.setStyleSheet(f"color: {self.theme['text_secondary']};")
+        image_label.setStyleSheet(sheets["label"])
         image_label.setFixedWidth(50)
         
         self.image_progress = QProgressBar()
         self.image_progress.setRange(0, 100)
         self.image_progress.setValue(self.task.image_progress)
         self.image_progress.setTextVisible(True)
-        self.image_progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {self.theme['border']};
-                border-radius: 4px;
-                text-align: center;
-                height: 16px;
-                color: {self.theme['text']};
-                background-color: {self.theme['input_bg']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['success']};
-                border-radius: 3px;
-            }}
-        """)
+        self.image_progress.setStyleSheet(sheets["image_progress"])
         
         image_layout.addWidget(image_label)
         image_layout.addWidget(self.image_progress)
@@ -126,7 +160,7 @@ class DownloadTaskCard(QWidget):
         
         # Info section (model name, time, etc.)
         self.info_label = QLabel()
-        self.info_label.setStyleSheet(f"color: {self.theme['text_secondary']}; font-size: 12px;")
+        self.info_label.setStyleSheet(sheets["info"])
         self.update_info_label()
         
         layout.addWidget(self.info_label)
@@ -134,18 +168,7 @@ class DownloadTaskCard(QWidget):
         # Cancel button (only for queued or downloading tasks)
         if self.task.status in [DOWNLOAD_STATUS["QUEUED"], DOWNLOAD_STATUS["DOWNLOADING"]]:
             self.cancel_btn = QPushButton("Cancel")
-            self.cancel_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {self.theme['danger']};
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.theme['danger_hover']};
-                }}
-            """)
+            self.cancel_btn.setStyleSheet(sheets["cancel_btn"])
             self.cancel_btn.clicked.connect(self.request_cancel)
             layout.addWidget(self.cancel_btn)
         
@@ -154,74 +177,27 @@ class DownloadTaskCard(QWidget):
         
     def apply_theme(self):
         """Apply the current theme to the widget"""
-        self.setStyleSheet(f"""
-            #downloadTaskCard {{
-                background-color: {self.theme["card"]};
-                border-radius: 8px;
-                border: 1px solid {self.theme["border"]};
-            }}
-            #downloadTaskCard:hover {{
-                border: 1px solid {self.theme["border_hover"]};
-                background-color: {self.theme["card_hover"]};
-            }}
-        """)
+        self.setStyleSheet(_ss(self.theme)["card"])
     
     def set_theme(self, theme):
         """Update the theme"""
         self.theme = theme
+        sheets = _ss(self.theme)
         self.apply_theme()
         
         # Update status label
         self.status_label.setStyleSheet(f"color: {self.task.get_status_color(self.theme)};")
         
         # Update progress bars
-        self.model_progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {self.theme['border']};
-                border-radius: 4px;
-                text-align: center;
-                height: 16px;
-                color: {self.theme['text']};
-                background-color: {self.theme['input_bg']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['accent']};
-                border-radius: 3px;
-            }}
-        """)
-        
-        self.image_progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {self.theme['border']};
-                border-radius: 4px;
-                text-align: center;
-                height: 16px;
-                color: {self.theme['text']};
-                background-color: {self.theme['input_bg']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['success']};
-                border-radius: 3px;
-            }}
-        """)
+        self.model_progress.setStyleSheet(sheets["model_progress"])
+        self.image_progress.setStyleSheet(sheets["image_progress"])
         
         # Update info label
-        self.info_label.setStyleSheet(f"color: {self.theme['text_secondary']}; font-size: 12px;")
+        self.info_label.setStyleSheet(sheets["info"])
         
         # Update cancel button if it exists
         if hasattr(self, 'cancel_btn'):
-            self.cancel_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {self.theme['danger']};
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.theme['danger_hover']};
-                }}
-            """)
+            self.cancel_btn.setStyleSheet(sheets["cancel_btn"])
     
     def update_task(self, task: DownloadTask):
         """Update the task and refresh the UI"""
@@ -4,10 +4,12 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTextEdit, QScrollArea, QApplication, QGroupBox
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QSize
 from PySide6.QtGui import QPixmap
 from pathlib import Path
 
+from src.utils.image_cache import fit_pixmap, load_cached_pixmap
+
 
 class ImageViewer(QWidget):
     """Widget for viewing images with metadata"""
@@ -19,6 +21,9 @@ class ImageViewer(QWidget):
         self.theme = theme
         self.current_image_index = 0
         self.images = []
+        
+        # Decoded current image, re-scaled on resize without touching the disk
+        self._pixmap: Optional[QPixmap] = None
         self.init_ui()
     
     def init_ui(self):
@@ -302,15 +307,11 @@ class ImageViewer(QWidget):
             
         img = self.images[index]
         
-        # Load and display image
+        # Load and display image, sharing decodes through QPixmapCache
+        self._pixmap = None
         if 'local_path' in img and Path(img['local_path']).exists():
-            pixmap = QPixmap(img['local_path'])
-            self.image_label.setPixmap(pixmap.scaled(
-                self.image_container.width() - 20, 
-                self.image_container.height() - 20,
-                Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
-            ))
+            self._pixmap = load_cached_pixmap(img['local_path'])
+            self.scale_image()
         else:
             self.image_label.setText("Image not available")
             
@@ -362,6 +363,7 @@ class ImageViewer(QWidget):
     
     def clear_display(self):
         """Clear the image display"""
+        self._pixmap = None
         self.image_label.clear()
         self.image_label.setText("No images available")
         self.prompt_text.clear()
@@ -380,16 +382,17 @@ class ImageViewer(QWidget):
             clipboard.setText(prompt)
             self.prompt_copied.emit(prompt)
     
+    def scale_image(self):
+        """Scale the decoded current image to the image container"""
+        if self._pixmap is None:
+            return
+        self.image_label.setPixmap(fit_pixmap(
+            self._pixmap,
+            self.image_container.size() - QSize(20, 20),
+            Qt.SmoothTransformation
+        ))
+    
     def resizeEvent(self, event):
         """Handle resize event to update image scaling"""
         super().resizeEvent(event)
-        if self.images and self.current_image_index < len(self.images):
-            img = self.images[self.current_image_index]
-            if 'local_path' in img and Path(img['local_path']).exists():
-                pixmap = QPixmap(img['local_path'])
-                self.image_label.setPixmap(pixmap.scaled(
-                    self.image_container.width() - 20, 
-                    self.image_container.height() - 20,
-                    Qt.KeepAspectRatio, 
-                    Qt.SmoothTransformation
-                ))
\ No newline at end of file
+        self.scale_image()
\ No newline at end of file
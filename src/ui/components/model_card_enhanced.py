@@ -13,6 +13,31 @@ from PySide6.QtGui import QPixmap, QColor, QPainter, QPainterPath, QLinearGradie
 
 from src.utils.formatting import truncate_text, format_size, format_date, format_rating
 
+# Favorite button stylesheets keyed by theme identity
+_FAVORITE_SS_CACHE: Dict[int, str] = {}
+
+
+def _favorite_stylesheet(theme: Dict[str, str]) -> str:
+    """Get the favorite button stylesheet for a theme, covering both states"""
+    sheet = _FAVORITE_SS_CACHE.get(id(theme))
+    if sheet is None:
+        sheet = _FAVORITE_SS_CACHE[id(theme)] = f"""
+            QPushButton {{
+                background-color: transparent;
+                color: {theme['text_secondary']};
+                font-size: 16px;
+                border: none;
+                padding: 0px;
+                width: 20px;
+                height: 20px;
+            }}
+            QPushButton[favorite="true"], QPushButton:hover {{
+                color: {theme['accent']};
+            }}
+        """
+    return sheet
+
+
 class ModelCard(QWidget):
     """Enhanced model card widget"""
     
@@ -134,20 +159,8 @@ class ModelCard(QWidget):
         # Favorite button
         self.favorite_btn = QPushButton("★" if self.is_favorite else "☆")
         self.favorite_btn.setToolTip("Remove from Favorites" if self.is_favorite else "Add to Favorites")
-        self.favorite_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {self.theme['accent'] if self.is_favorite else self.theme['text_secondary']};
-                font-size: 16px;
-                border: none;
-                padding: 0px;
-                width: 20px;
-                height: 20px;
-            }}
-            QPushButton:hover {{
-                color: {self.theme['accent']};
-            }}
-        """)
+        self.favorite_btn.setProperty("favorite", self.is_favorite)
+        self.favorite_btn.setStyleSheet(_favorite_stylesheet(self.theme))
         self.favorite_btn.clicked.connect(self.toggle_favorite)
         stats_layout.addWidget(self.favorite_btn)
         
@@ -208,20 +221,10 @@ class ModelCard(QWidget):
         self.is_favorite = not self.is_favorite
         self.favorite_btn.setText("★" if self.is_favorite else "☆")
         self.favorite_btn.setToolTip("Remove from Favorites" if self.is_favorite else "Add to Favorites")
-        self.favorite_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {self.theme['accent'] if self.is_favorite else self.theme['text_secondary']};
-                font-size: 16px;
-                border: none;
-                padding: 0px;
-                width: 20px;
-                height: 20px;
-            }}
-            QPushButton:hover {{
-                color: {self.theme['accent']};
-            }}
-        """)
+        
+        # Re-polish against the cached sheet instead of formatting a new one
+        self.favorite_btn.setProperty("favorite", self.is_favorite)
+        self.favorite_btn.style().polish(self.favorite_btn)
         self.favorite_toggled.emit(self.model_data, self.is_favorite)
     
     def mousePressEvent(self, event):
@@ -342,20 +345,7 @@ class ModelCard(QWidget):
                 child.setStyleSheet(f"color: {self.theme['text_secondary']}; font-size: 12px;")
         
         # Update favorite button
-        self.favorite_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {self.theme['accent'] if self.is_favorite else self.theme['text_secondary']};
-                font-size: 16px;
-                border: none;
-                padding: 0px;
-                width: 20px;
-                height: 20px;
-            }}
-            QPushButton:hover {{
-                color: {self.theme['accent']};
-            }}
-        """)
+        self.favorite_btn.setStyleSheet(_favorite_stylesheet(self.theme))
         
         # Update thumbnail if it's showing placeholder text
         if not self.thumbnail.pixmap():
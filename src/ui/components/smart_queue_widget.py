@@ -1,14 +1,17 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
-    QScrollArea, QGridLayout, QProgressBar, QSizePolicy, QMenu
+    QScrollArea, QGridLayout, QProgressBar, QSizePolicy, QMenu, QApplication
 )
-from PySide6.QtCore import Qt, Signal, QSize, QMimeData, QRect
-from PySide6.QtGui import QPixmap, QIcon, QColor, QPainter, QPalette, QImage, QCursor, QDrag
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QMimeData, QRect, QTimer
+from PySide6.QtGui import QPixmap, QIcon, QColor, QPainter, QPalette, QImage, QCursor, QDrag, QFont
 
+from collections import deque
+
+import numpy as np
 import pyqtgraph as pg
 import time
-from typing import Dict, List
+from typing import Callable, Dict, List, Tuple
 
 from src.constants.constants import DOWNLOAD_STATUS
 from src.models.download_task import DownloadTask
@@ -17,12 +20,162 @@ from src.utils.formatting import format_size, get_time_display
 
 logger = get_logger(__name__)
 
+# Queued tasks get cards in batches of this many; later ones wait for a scroll to the end
+QUEUED_BATCH_SIZE = 50
+
+# Distance in pixels from the end of the queue at which the next batch is added
+LOAD_MORE_MARGIN = 200
+
+# Detached cards kept around for reuse by new tasks
+MAX_POOLED_CARDS = 20
+
+# Formatted stylesheets keyed by (id(theme), role); themes are module-level singletons
+_SS_CACHE: Dict[Tuple[int, str], str] = {}
+
+# Bold fonts shared by every card, keyed by pixel size (created after QApplication exists)
+_BOLD_FONTS: Dict[int, QFont] = {}
+
+
+def _bold_font(pixel_size: int) -> QFont:
+    """Get a shared bold font of the given pixel size"""
+    font = _BOLD_FONTS.get(pixel_size)
+    if font is None:
+        font = QFont()
+        font.setPixelSize(pixel_size)
+        font.setBold(True)
+        _BOLD_FONTS[pixel_size] = font
+    return font
+
+
+# Status -> indicator color maps keyed by id(theme)
+_STATUS_COLORS: Dict[int, Dict[str, str]] = {}
+
+
+def _status_colors(theme: Dict) -> Dict[str, str]:
+    """Get the indicator color of every download status for a theme"""
+    colors = _STATUS_COLORS.get(id(theme))
+    if colors is None:
+        colors = _STATUS_COLORS[id(theme)] = {
+            status: DownloadTask.status_color(status, theme)
+            for status in DOWNLOAD_STATUS.values()
+        }
+    return colors
+
+
+def _cached_ss(theme: Dict, role: str, build: Callable[[Dict], str]) -> str:
+    """Get a stylesheet for a theme, building it only the first time"""
+    key = (id(theme), role)
+    sheet = _SS_CACHE.get(key)
+    if sheet is None:
+        sheet = _SS_CACHE[key] = build(theme)
+    return sheet
+
+
+def _card_stylesheet(theme: Dict) -> str:
+    """Get the single stylesheet installed on a QueueItemCard"""
+    return _cached_ss(theme, "card", _build_card_stylesheet)
+
+
+def _menu_stylesheet(theme: Dict) -> str:
+    """Get the stylesheet for the queue card context menu"""
+    return _cached_ss(theme, "menu", _build_menu_stylesheet)
+
+
+def _build_menu_stylesheet(theme: Dict) -> str:
+    """Build the stylesheet for the queue card context menu"""
+    return f"""
+        QMenu {{
+            background-color: {theme['secondary']};
+            color: {theme['text']};
+            border: 1px solid {theme['border']};
+            border-radius: 4px;
+            padding: 4px;
+        }}
+        QMenu::item {{
+            padding: 6px 24px;
+            border-radius: 2px;
+        }}
+        QMenu::item:selected {{
+            background-color: {theme['accent']};
+            color: white;
+        }}
+        QMenu::separator {{
+            height: 1px;
+            background-color: {theme['border']};
+            margin: 6px 0px;
+        }}
+    """
+
+
+def _build_card_stylesheet(theme: Dict) -> str:
+    """Build the single stylesheet installed on a QueueItemCard"""
+    status_rules = "".join(
+        f"""
+        QLabel#queueStatus[state="{status}"] {{
+            background-color: {color};
+        }}"""
+        for status, color in _status_colors(theme).items()
+    )
+    return f"""
+        QFrame {{
+            background-color: {theme['card']};
+            border-radius: 8px;
+            border: 1px solid {theme['border']};
+            padding: 8px;
+        }}
+        QFrame:hover {{
+            background-color: {theme['card_hover']};
+            border-color: {theme['border_hover']};
+        }}
+        QLabel#queuePosition {{
+            color: {theme['text_tertiary']};
+            background-color: {theme['secondary']};
+            padding: 2px 6px;
+            border-radius: 8px;
+        }}
+        QLabel#queueTitle {{
+            color: {theme['text']};
+            font-weight: bold;
+        }}
+        QLabel#queueStatus {{
+            color: white;
+            padding: 2px 6px;
+            border-radius: 4px;
+            font-size: 11px;
+        }}{status_rules}
+        QLabel#queueProgressLabel {{
+            color: {theme['text_secondary']};
+        }}
+        QLabel#queueError {{
+            color: {theme['danger']};
+        }}
+        QPushButton#queueCancelButton {{
+            background-color: transparent;
+            border: none;
+            color: {theme['text_secondary']};
+        }}
+        QPushButton#queueCancelButton:hover {{
+            color: {theme['danger']};
+        }}
+    """
+
+
+def _apply_progress_palette(bar: QProgressBar, theme: Dict, chunk_color: str):
+    """Color a progress bar through its palette so it keeps the native painter"""
+    palette = bar.palette()
+    palette.setColor(QPalette.Highlight, QColor(chunk_color))
+    palette.setColor(QPalette.Base, QColor(theme['input_bg']))
+    palette.setColor(QPalette.Text, QColor(theme['text']))
+    bar.setPalette(palette)
+
 
 class QueueItemCard(QFrame):
     """Card widget for a queue item"""
 
     cancel_requested = Signal(str)  # url
     move_requested = Signal(str, int)  # url, new_position
+    move_to_top_requested = Signal(str)  # url
+    move_to_bottom_requested = Signal(str)  # url
     
     def __init__(self, task: DownloadTask, position: int, theme: Dict, parent=None):
         super().__init__(parent)
@@ -31,23 +184,29 @@ class QueueItemCard(QFrame):
         self.theme = theme
         self.drag_start_position = None
         
-        # Set up frame styles
+        # Last values pushed to the widgets, used to skip redundant repaints
+        self._last_model_pct = -1
+        self._last_image_pct = -1
+        self._last_status = None
+        
+        # Scaled-down card preview used while dragging, rebuilt when the card changes
+        self._drag_pixmap = None
+        
+        # Context menu, built on first right click
+        self._menu = None
+        
+        # Coalesce bursts of progress updates to at most ~10 per second
+        self._pending_update = False
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(100)
+        self._update_timer.timeout.connect(self._flush_pending_update)
+        
+        # Set up frame styles (one sheet for the card and all its children)
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self.theme['card']};
-                border-radius: 8px;
-                border: 1px solid {self.theme['border']};
-                padding: 8px;
-            }}
-            QFrame:hover {{
-                background-color: {self.theme['card_hover']};
-                border-color: {self.theme['border_hover']};
-            }}
-        """)
+        self.setStyleSheet(_card_stylesheet(self.theme))
         
         self.setAcceptDrops(True)  # Enable drop events
-        self.setMouseTracking(True)  # Track mouse for dragging
         
         self.init_ui()
     
@@ -63,14 +222,8 @@ class QueueItemCard(QFrame):
         
         # Position indicator
         self.position_label = QLabel(f"#{self.position + 1}")
-        self.position_label.setStyleSheet(f"""
-            color: {self.theme['text_tertiary']};
-            font-size: 12px;
-            font-weight: bold;
-            background-color: {self.theme['secondary']};
-            padding: 2px 6px;
-            border-radius: 8px;
-        """)
+        self.position_label.setObjectName("queuePosition")
+        self.position_label.setFont(_bold_font(12))
         self.position_label.setFixedWidth(30)
         self.position_label.setAlignment(Qt.AlignCenter)
         
@@ -78,39 +231,21 @@ class QueueItemCard(QFrame):
         model_info = self.task.model_info
         title = model_info.name if model_info else "Loading..."
         self.title_label = QLabel(title)
-        self.title_label.setStyleSheet(f"""
-            color: {self.theme['text']};
-            font-weight: bold;
-        """)
+        self.title_label.setObjectName("queueTitle")
         self.title_label.setWordWrap(True)
         self.title_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         
         # Status indicator
         self.status_indicator = QLabel(self.task.status)
-        status_color = self.task.get_status_color(self.theme)
-        self.status_indicator.setStyleSheet(f"""
-            color: white;
-            background-color: {status_color};
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-size: 11px;
-        """)
+        self.status_indicator.setObjectName("queueStatus")
+        self.status_indicator.setProperty("state", self.task.status)
+        self._last_status = self.task.status
         
         # Cancel button
         self.cancel_btn = QPushButton("✕")
+        self.cancel_btn.setObjectName("queueCancelButton")
+        self.cancel_btn.setFont(_bold_font(14))
         self.cancel_btn.setFixedSize(24, 24)
-        self.cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                color: {self.theme['text_secondary']};
-                font-weight: bold;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                color: {self.theme['danger']};
-            }}
-        """)
         self.cancel_btn.clicked.connect(self.cancel_download)
         
         header_layout.addWidget(self.position_label)
@@ -125,45 +260,29 @@ class QueueItemCard(QFrame):
         # Model progress bar
         model_progress_layout = QHBoxLayout()
         self.model_progress = QProgressBar()
+        self.model_progress.setObjectName("queueModelProgress")
         self.model_progress.setRange(0, 100)
         self.model_progress.setValue(self.task.model_progress)
+        self._last_model_pct = self.task.model_progress
         self.model_progress.setTextVisible(True)
-        self.model_progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                background-color: {self.theme['input_bg']};
-                color: {self.theme['text']};
-                text-align: center;
-                border-radius: 3px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['accent']};
-                border-radius: 3px;
-            }}
-        """)
-        model_progress_layout.addWidget(QLabel("Model:"))
+        _apply_progress_palette(self.model_progress, self.theme, self.theme['accent'])
+        self.model_label = QLabel("Model:")
+        self.model_label.setObjectName("queueProgressLabel")
+        model_progress_layout.addWidget(self.model_label)
         model_progress_layout.addWidget(self.model_progress)
         
         # Images progress bar
         image_progress_layout = QHBoxLayout()
         self.image_progress = QProgressBar()
+        self.image_progress.setObjectName("queueImageProgress")
         self.image_progress.setRange(0, 100)
         self.image_progress.setValue(self.task.image_progress)
+        self._last_image_pct = self.task.image_progress
         self.image_progress.setTextVisible(True)
-        self.image_progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                background-color: {self.theme['input_bg']};
-                color: {self.theme['text']};
-                text-align: center;
-                border-radius: 3px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['info']};
-                border-radius: 3px;
-            }}
-        """)
-        image_progress_layout.addWidget(QLabel("Images:"))
+        _apply_progress_palette(self.image_progress, self.theme, self.theme['info'])
+        self.image_label = QLabel("Images:")
+        self.image_label.setObjectName("queueProgressLabel")
+        image_progress_layout.addWidget(self.image_label)
         image_progress_layout.addWidget(self.image_progress)
         
         progress_layout.addLayout(model_progress_layout)
@@ -172,51 +291,111 @@ class QueueItemCard(QFrame):
         layout.addLayout(header_layout)
         layout.addLayout(progress_layout)
         
+        # Progress rows are only shown (and repainted) while downloading
+        self._set_progress_visible(self.task.status == DOWNLOAD_STATUS["DOWNLOADING"])
+        
         # Error message
         if self.task.error_message:
             self.error_label = QLabel(self.task.error_message)
+            self.error_label.setObjectName("queueError")
             self.error_label.setWordWrap(True)
-            self.error_label.setStyleSheet(f"color: {self.theme['danger']};")
             layout.addWidget(self.error_label)
     
+    @Slot(object)
     def update_task(self, task):
-        """Update task data"""
+        """Update task data (throttled to ~10 Hz)"""
         self.task = task
         
+        if self._update_timer.isActive():
+            # Applied with the latest task data when the timer fires
+            self._pending_update = True
+            return
+        
+        self._apply_task(task)
+        self._update_timer.start()
+    
+    @Slot()
+    def _flush_pending_update(self):
+        """Apply the most recent update deferred by the throttle"""
+        if self._pending_update:
+            self._pending_update = False
+            self._apply_task(self.task)
+            self._update_timer.start()
+    
+    def _apply_task(self, task):
+        """Push task data to the widgets, skipping unchanged values"""
         # Update title if model info is available
-        if task.model_info:
+        if task.model_info and task.model_info.name != self.title_label.text():
             self.title_label.setText(task.model_info.name)
+            self._drag_pixmap = None
         
         # Update progress bars
-        self.model_progress.setValue(task.model_progress)
-        self.image_progress.setValue(task.image_progress)
+        if task.model_progress != self._last_model_pct:
+            self.model_progress.setValue(task.model_progress)
+            self._last_model_pct = task.model_progress
+            self._drag_pixmap = None
+        
+        if task.image_progress != self._last_image_pct:
+            self.image_progress.setValue(task.image_progress)
+            self._last_image_pct = task.image_progress
+            self._drag_pixmap = None
         
         # Update status indicator
-        self.status_indicator.setText(task.status)
-        status_color = task.get_status_color(self.theme)
-        self.status_indicator.setStyleSheet(f"""
-            color: white;
-            background-color: {status_color};
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-size: 11px;
-        """)
+        if task.status != self._last_status:
+            self._last_status = task.status
+            self.status_indicator.setText(task.status)
+            self.status_indicator.setProperty("state", task.status)
+            
+            # Re-evaluate the [state=...] selectors for the new value
+            style = self.status_indicator.style()
+            style.unpolish(self.status_indicator)
+            style.polish(self.status_indicator)
+            
+            self._set_progress_visible(task.status == DOWNLOAD_STATUS["DOWNLOADING"])
+            self._drag_pixmap = None
         
         # Update error message
         if task.error_message:
+            self._drag_pixmap = None
             if hasattr(self, 'error_label'):
                 self.error_label.setText(task.error_message)
+                self.error_label.show()
             else:
                 self.error_label = QLabel(task.error_message)
+                self.error_label.setObjectName("queueError")
                 self.error_label.setWordWrap(True)
-                self.error_label.setStyleSheet(f"color: {self.theme['danger']};")
                 self.layout().addWidget(self.error_label)
     
+    def reset_task(self, task: DownloadTask, position: int):
+        """Rebind a pooled card to a different task"""
+        self._update_timer.stop()
+        self._pending_update = False
+        self._last_model_pct = -1
+        self._last_image_pct = -1
+        self._last_status = None
+        self.drag_start_position = None
+        
+        self.task = task
+        self.title_label.setText(task.model_info.name if task.model_info else "Loading...")
+        if hasattr(self, 'error_label'):
+            self.error_label.hide()
+        
+        self.set_position(position)
+        self._apply_task(task)
+    
+    def _set_progress_visible(self, visible: bool):
+        """Show or hide both progress rows"""
+        for widget in (self.model_label, self.model_progress, self.image_label, self.image_progress):
+            widget.setVisible(visible)
+    
+    @Slot(int)
     def set_position(self, position):
         """Set position indicator"""
         self.position = position
         self.position_label.setText(f"#{position + 1}")
+        self._drag_pixmap = None
     
+    @Slot()
     def cancel_download(self):
         """Emit cancel signal"""
         self.cancel_requested.emit(self.task.url)
@@ -246,15 +425,31 @@ class QueueItemCard(QFrame):
         mime_data.setText(self.task.url)  # Store the URL for identification
         drag.setMimeData(mime_data)
         
-        # Create a pixmap with card preview
-        pixmap = QPixmap(self.size())
-        self.render(pixmap)
-        drag.setPixmap(pixmap.scaledToWidth(200, Qt.SmoothTransformation))
-        drag.setHotSpot(event.pos())
+        # Card preview rendered straight at drag size
+        scale = 200 / max(self.width(), 1)
+        drag.setPixmap(self._get_drag_pixmap(scale))
+        drag.setHotSpot(event.pos() * scale)
         
         # Execute drag and handle result
         result = drag.exec_(Qt.MoveAction)
     
+    def _get_drag_pixmap(self, scale: float) -> QPixmap:
+        """Render the card into a 200px wide pixmap, reusing the last one if still valid"""
+        target_size = QSize(200, max(1, int(self.height() * scale)))
+        if self._drag_pixmap is None or self._drag_pixmap.size() != target_size:
+            pixmap = QPixmap(target_size)
+            pixmap.fill(Qt.transparent)
+            
+            # Ephemeral preview: nearest-neighbour sampling is good enough
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+            painter.scale(scale, scale)
+            self.render(painter)
+            painter.end()
+            
+            self._drag_pixmap = pixmap
+        return self._drag_pixmap
+    
     def dragEnterEvent(self, event):
         """Handle drag enter event"""
         if event.mimeData().hasText() and self.task.status == DOWNLOAD_STATUS["QUEUED"]:
@@ -269,160 +464,67 @@ class QueueItemCard(QFrame):
     
     def contextMenuEvent(self, event):
         """Show context menu on right click"""
-        menu = QMenu(self)
+        if self._menu is None:
+            self._build_menu()
         
         # Only show move options for queued tasks
-        if self.task.status == DOWNLOAD_STATUS["QUEUED"]:
-            # Add priority actions
-            top = menu.addAction("Move to Top")
-            up = menu.addAction("Move Up")
-            down = menu.addAction("Move Down")
-            bottom = menu.addAction("Move to Bottom")
-            menu.addSeparator()
-        
-        # Add cancel action
-        cancel = menu.addAction("Cancel")
-        
-        # Style the menu
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {self.theme['secondary']};
-                color: {self.theme['text']};
-                border: 1px solid {self.theme['border']};
-                border-radius: 4px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 6px 24px;
-                border-radius: 2px;
-            }}
-            QMenu::item:selected {{
-                background-color: {self.theme['accent']};
-                color: white;
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background-color: {self.theme['border']};
-                margin: 6px 0px;
-            }}
-        """)
+        queued = self.task.status == DOWNLOAD_STATUS["QUEUED"]
+        for move_action in self._move_actions:
+            move_action.setVisible(queued)
         
         # Show menu and handle actions
-        action = menu.exec_(event.globalPos())
+        action = self._menu.exec_(event.globalPos())
         
         if not action:
             return
             
-        if self.task.status == DOWNLOAD_STATUS["QUEUED"]:
-            if action == top:
-                self.move_requested.emit(self.task.url, 0)
-            elif action == up and self.position > 0:
+        if queued:
+            if action == self._act_top:
+                self.move_to_top_requested.emit(self.task.url)
+            elif action == self._act_up and self.position > 0:
                 self.move_requested.emit(self.task.url, self.position - 1)
-            elif action == down:
+            elif action == self._act_down:
                 self.move_requested.emit(self.task.url, self.position + 1)
-            elif action == bottom:
-                self.move_requested.emit(self.task.url, 999)  # Large number for bottom
+            elif action == self._act_bottom:
+                self.move_to_bottom_requested.emit(self.task.url)
         
-        if action == cancel:
+        if action == self._act_cancel:
             self.cancel_requested.emit(self.task.url)
     
+    def _build_menu(self):
+        """Create the context menu and its actions once"""
+        self._menu = QMenu(self)
+        
+        # Priority actions (hidden unless the task is queued)
+        self._act_top = self._menu.addAction("Move to Top")
+        self._act_up = self._menu.addAction("Move Up")
+        self._act_down = self._menu.addAction("Move Down")
+        self._act_bottom = self._menu.addAction("Move to Bottom")
+        separator = self._menu.addSeparator()
+        self._move_actions = (self._act_top, self._act_up, self._act_down, self._act_bottom, separator)
+        
+        # Add cancel action
+        self._act_cancel = self._menu.addAction("Cancel")
+        
+        # Style the menu
+        self._menu.setStyleSheet(_menu_stylesheet(self.theme))
+    
+    @Slot(dict)
     def set_theme(self, theme):
         """Update theme colors"""
+        # Themes are swapped, never mutated: the same object means nothing to restyle
+        if theme is self.theme:
+            return
         self.theme = theme
         
-        # Update styles
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self.theme['card']};
-                border-radius: 8px;
-                border: 1px solid {self.theme['border']};
-                padding: 8px;
-            }}
-            QFrame:hover {{
-                background-color: {self.theme['card_hover']};
-                border-color: {self.theme['border_hover']};
-            }}
-        """)
+        # Children are styled through the card's own sheet
+        self.setStyleSheet(_card_stylesheet(self.theme))
+        _apply_progress_palette(self.model_progress, self.theme, self.theme['accent'])
+        _apply_progress_palette(self.image_progress, self.theme, self.theme['info'])
+        self._drag_pixmap = None
         
-        # Position indicator
-        self.position_label.setStyleSheet(f"""
-            color: {self.theme['text_tertiary']};
-            font-size: 12px;
-            font-weight: bold;
-            background-color: {self.theme['secondary']};
-            padding: 2px 6px;
-            border-radius: 8px;
-        """)
-        
-        # Title label
-        self.title_label.setStyleSheet(f"""
-            color: {self.theme['text']};
-            font-weight: bold;
-        """)
-        
-        # Status indicator
-        status_color = self.task.get_status_color(self.theme)
-        self.status_indicator.setStyleSheet(f"""
-            color: white;
-            background-color: {status_color};
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-size: 11px;
-        """)
-        
-        # Cancel button
-        self.cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                color: {self.theme['text_secondary']};
-                font-weight: bold;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                color: {self.theme['danger']};
-            }}
-        """)
-        
-        # Progress bars
-        self.model_progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                background-color: {self.theme['input_bg']};
-                color: {self.theme['text']};
-                text-align: center;
-                border-radius: 3px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['accent']};
-                border-radius: 3px;
-            }}
-        """)
-        
-        self.image_progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                background-color: {self.theme['input_bg']};
-                color: {self.theme['text']};
-                text-align: center;
-                border-radius: 3px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['info']};
-                border-radius: 3px;
-            }}
-        """)
-        
-        # Error label
-        if hasattr(self, 'error_label'):
-            self.error_label.setStyleSheet(f"color: {self.theme['danger']};")
-        
-        # Update progress label colors
-        for label in self.findChildren(QLabel):
-            if label != self.title_label and label != self.position_label and label != self.status_indicator:
-                if hasattr(self, 'error_label') and label == self.error_label:
-                    continue
-                label.setStyleSheet(f"color: {self.theme['text_secondary']};")
+        if self._menu is not None:
+            self._menu.setStyleSheet(_menu_stylesheet(self.theme))
 
 
 class SmartQueueWidget(QWidget):
@@ -431,11 +533,27 @@ class SmartQueueWidget(QWidget):
     cancel_requested = Signal(str)  # url
     clear_requested = Signal()  # No parameters
     move_requested = Signal(str, int)  # url, new_position
+    move_to_top_requested = Signal(str)  # url
+    move_to_bottom_requested = Signal(str)  # url
     
     def __init__(self, theme: Dict, parent=None):
         super().__init__(parent)
         self.theme = theme
         self.task_widgets = {}  # url -> QueueItemCard
+        self._ordered_urls: List[str] = []  # urls of the cards currently in queue_layout, in order
+        self._tasks: Dict[str, DownloadTask] = {}  # url -> latest task data, in queue order
+        self._queued_limit = QUEUED_BATCH_SIZE  # queued tasks allowed a card
+        self._pool: List[QueueItemCard] = []  # detached cards ready for reuse
+        
+        # Bandwidth graph repaints are limited to ~10 per second
+        self._last_bw_paint = 0.0
+        self._pending_bw = None  # (times, mb_values) waiting for the throttle
+        self._y_max = 0.0  # current top of the graph's y range
+        self._x_range = None  # current (min, max) of the graph's x range
+        self._bw_timer = QTimer(self)
+        self._bw_timer.setSingleShot(True)
+        self._bw_timer.timeout.connect(self._apply_pending_bandwidth)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -449,8 +567,8 @@ class SmartQueueWidget(QWidget):
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(10, 10, 10, 10)
         
-        title = QLabel("Download Queue")
-        title.setStyleSheet(f"""
+        self.title_label = QLabel("Download Queue")
+        self.title_label.setStyleSheet(f"""
             font-size: 16px;
             font-weight: bold;
             color: {self.theme['text']};
@@ -471,16 +589,17 @@ class SmartQueueWidget(QWidget):
         """)
         self.clear_btn.clicked.connect(self.clear_queue)
         
-        header_layout.addWidget(title)
+        header_layout.addWidget(self.title_label)
         header_layout.addStretch()
         header_layout.addWidget(self.clear_btn)
         
         # Queue items scroll area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet(f"""
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self.on_queue_scrolled)
+        self.scroll_area.setStyleSheet(f"""
             QScrollArea {{
                 background-color: transparent;
                 border: none;
@@ -525,15 +644,34 @@ class SmartQueueWidget(QWidget):
         """)
         self.queue_layout.addWidget(self.empty_label)
         
-        scroll_area.setWidget(self.queue_container)
+        # Loads queued tasks that have no card yet (always last in the layout)
+        self.show_more_btn = QPushButton()
+        self.show_more_btn.setCursor(Qt.PointingHandCursor)
+        self.show_more_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: transparent;
+                color: {self.theme['text_secondary']};
+                border: none;
+                font-style: italic;
+                padding: 8px;
+            }}
+            QPushButton:hover {{
+                color: {self.theme['accent']};
+            }}
+        """)
+        self.show_more_btn.clicked.connect(self.show_more_queued)
+        self.show_more_btn.hide()
+        self.queue_layout.addWidget(self.show_more_btn)
+        
+        self.scroll_area.setWidget(self.queue_container)
         
         # Bandwidth graph
         self.graph_container = QWidget()
         graph_layout = QVBoxLayout(self.graph_container)
         graph_layout.setContentsMargins(10, 0, 10, 10)
         
-        graph_title = QLabel("Bandwidth Usage")
-        graph_title.setStyleSheet(f"""
+        self.graph_title = QLabel("Bandwidth Usage")
+        self.graph_title.setStyleSheet(f"""
             font-size: 14px;
             font-weight: bold;
             color: {self.theme['text']};
@@ -548,6 +686,13 @@ class SmartQueueWidget(QWidget):
             [], [], pen=pg.mkPen(color=self.theme["accent"], width=2)
         )
         
+        # Ranges are managed in _paint_bandwidth; draw at most one point per pixel
+        plot_item = self.bandwidth_graph.getPlotItem()
+        plot_item.setDownsampling(auto=True, mode='peak')
+        plot_item.setClipToView(True)
+        self.bandwidth_graph.setMouseEnabled(x=False, y=False)
+        self.bandwidth_graph.enableAutoRange(enable=False)
+        
         # Set axis labels
         self.bandwidth_graph.setLabel('left', 'MB/s')
         self.bandwidth_graph.setLabel('bottom', 'Time (s)')
@@ -557,54 +702,161 @@ class SmartQueueWidget(QWidget):
         # Set grid
         self.bandwidth_graph.showGrid(x=True, y=True, alpha=0.3)
         
-        graph_layout.addWidget(graph_title)
+        graph_layout.addWidget(self.graph_title)
         graph_layout.addWidget(self.bandwidth_graph)
         
         # Add all components to main layout
         layout.addWidget(header)
-        layout.addWidget(scroll_area, 1)  # Give scroll area all available space
+        layout.addWidget(self.scroll_area, 1)  # Give scroll area all available space
         layout.addWidget(self.graph_container)
     
+    @Slot(list)
     def update_tasks(self, tasks: List[DownloadTask]):
         """Update all tasks in the queue"""
+        self._tasks = {task.url: task for task in tasks}
+        
+        # Suspend painting so the whole refresh results in a single repaint
+        self.queue_container.setUpdatesEnabled(False)
+        try:
+            self._update_tasks(tasks)
+        finally:
+            self.queue_container.setUpdatesEnabled(True)
+    
+    def _update_tasks(self, tasks: List[DownloadTask]):
+        """Rebuild the queue contents; called with updates disabled"""
+        # Partition in one pass; only the 5 most recent finished tasks are kept
+        queued_tasks = []
+        active_task = None
+        completed_tasks = deque(maxlen=5)
+        
+        for t in tasks:
+            if t.status == DOWNLOAD_STATUS["QUEUED"]:
+                queued_tasks.append(t)
+            elif t.status == DOWNLOAD_STATUS["DOWNLOADING"]:
+                if active_task is None:
+                    active_task = t
+            else:
+                completed_tasks.append(t)
+        
         # Sort tasks by priority
-        queued_tasks = [t for t in tasks if t.status == DOWNLOAD_STATUS["QUEUED"]]
         queued_tasks.sort(key=lambda t: t.priority)
         
-        active_task = next((t for t in tasks if t.status == DOWNLOAD_STATUS["DOWNLOADING"]), None)
-        completed_tasks = [t for t in tasks if t.status in [DOWNLOAD_STATUS["COMPLETED"], DOWNLOAD_STATUS["FAILED"], DOWNLOAD_STATUS["CANCELED"]]]
-        
-        # Clear existing widgets
-        self.clear_queue_widgets()
-        
         # Show empty state if no tasks
         if not queued_tasks and not active_task and not completed_tasks:
+            self.clear_queue_widgets()
+            self._queued_limit = QUEUED_BATCH_SIZE
+            self.show_more_btn.hide()
             self.empty_label.show()
             return
         else:
             self.empty_label.hide()
         
-        # Add active task first if any
+        # Desired order: active task, queued tasks, then the 5 most recent finished ones
+        desired_urls = []
+        
         if active_task:
-            self.add_task_widget(active_task, 0)
+            self.get_task_widget(active_task, 0)
+            desired_urls.append(active_task.url)
         
-        # Add queued tasks
-        for i, task in enumerate(queued_tasks):
+        # Cards are made for the loaded head of the queue; the rest follow on scrolling
+        for i, task in enumerate(queued_tasks[:self._queued_limit]):
             position = i + (1 if active_task else 0)
-            self.add_task_widget(task, position)
+            self.get_task_widget(task, position)
+            desired_urls.append(task.url)
             
-        # Add completed tasks (limit to most recent 5)
-        for task in completed_tasks[:5]:
-            # Add at the bottom without specific position
-            self.add_task_widget(task, -1)
+        for task in completed_tasks:
+            # Keep their last position, they are shown at the bottom
+            self.get_task_widget(task, -1)
+            desired_urls.append(task.url)
+        
+        # Only move the cards whose position changed
+        self._sync_layout(desired_urls)
+        self.update_show_more()
+    
+    def _is_queued(self, url: str) -> bool:
+        """Check whether the latest data for a task has it queued"""
+        task = self._tasks.get(url)
+        return task is not None and task.status == DOWNLOAD_STATUS["QUEUED"]
+    
+    def update_show_more(self):
+        """Offer the queued tasks that have no card yet"""
+        hidden_count = sum(1 for url in self._tasks if url not in self.task_widgets and self._is_queued(url))
+        if hidden_count > 0:
+            self.show_more_btn.setText(f"Show {hidden_count} more queued")
+            self.show_more_btn.show()
+        else:
+            self.show_more_btn.hide()
+    
+    @Slot()
+    def show_more_queued(self):
+        """Give the next batch of queued tasks their cards"""
+        self._queued_limit += QUEUED_BATCH_SIZE
+        self.update_tasks(list(self._tasks.values()))
+    
+    @Slot(int)
+    def on_queue_scrolled(self, value: int):
+        """Load the next batch of queued tasks as the list nears its end"""
+        if self.show_more_btn.isHidden():
+            return
+        if value >= self.scroll_area.verticalScrollBar().maximum() - LOAD_MORE_MARGIN:
+            self.show_more_queued()
+    
+    def _sync_layout(self, desired_urls: List[str]):
+        """Reorder queue_layout to match desired_urls, touching only moved cards"""
+        current = self._ordered_urls
+        
+        for i, url in enumerate(desired_urls):
+            if i < len(current) and current[i] == url:
+                continue
+            
+            card = self.task_widgets[url]
+            if url in current:
+                current.remove(url)
+                self.queue_layout.removeWidget(card)
+            
+            # Index 0 of the layout is the empty state label
+            self.queue_layout.insertWidget(i + 1, card)
+            current.insert(i, url)
+        
+        # Detach cards that are no longer shown and recycle them
+        for url in current[len(desired_urls):]:
+            self._release_card(url)
+        del current[len(desired_urls):]
+    
+    def _release_card(self, url: str):
+        """Take a task's card out of the layout and return it to the pool"""
+        card = self.task_widgets.pop(url)
+        self.queue_layout.removeWidget(card)
+        card.setParent(None)
+        
+        if len(self._pool) < MAX_POOLED_CARDS:
+            self._pool.append(card)
+        else:
+            card.deleteLater()
     
     def add_task_widget(self, task: DownloadTask, position: int):
-        """Add a task widget to the queue"""
-        # Create widget if it doesn't exist
+        """Add a task widget to the end of the queue"""
+        card = self.get_task_widget(task, position)
+        
+        # Add to layout if not already added (after the last card, before the show more button)
+        if task.url not in self._ordered_urls:
+            self._ordered_urls.append(task.url)
+            self.queue_layout.insertWidget(len(self._ordered_urls), card)
+    
+    def get_task_widget(self, task: DownloadTask, position: int) -> QueueItemCard:
+        """Get the card for a task, creating or updating it as needed"""
+        # Reuse a pooled card, or create one if the pool is empty
         if task.url not in self.task_widgets:
-            card = QueueItemCard(task, position, self.theme)
-            card.cancel_requested.connect(self.cancel_requested)
-            card.move_requested.connect(self.move_requested)
+            if self._pool:
+                card = self._pool.pop()
+                card.set_theme(self.theme)
+                card.reset_task(task, position)
+            else:
+                card = QueueItemCard(task, position, self.theme)
+                card.cancel_requested.connect(self.cancel_requested)
+                card.move_requested.connect(self.move_requested)
+                card.move_to_top_requested.connect(self.move_to_top_requested)
+                card.move_to_bottom_requested.connect(self.move_to_bottom_requested)
             self.task_widgets[task.url] = card
         else:
             # Update existing widget
@@ -613,58 +865,96 @@ class SmartQueueWidget(QWidget):
             if position >= 0:
                 card.set_position(position)
         
-        # Add to layout if not already added
-        if card.parent() is None:
-            self.queue_layout.addWidget(card)
+        return card
     
+    @Slot(object)
     def update_task(self, task: DownloadTask):
         """Update a specific task"""
+        self._tasks[task.url] = task
         if task.url in self.task_widgets:
             self.task_widgets[task.url].update_task(task)
-        else:
+            return
+        
+        # Counted from the cards, so status changes since the last refresh are included
+        queued_cards = sum(1 for url in self.task_widgets if self._is_queued(url))
+        if task.status != DOWNLOAD_STATUS["QUEUED"] or queued_cards < self._queued_limit:
             # Get all tasks and find position for this one
             self.add_task_widget(task, -1)
+        self.update_show_more()
     
     def clear_queue_widgets(self):
         """Remove all queue widgets"""
-        # Hide all widgets (we keep them for reuse)
-        for widget in self.task_widgets.values():
-            widget.setParent(None)
+        # Detach all widgets (recycled through the pool)
+        for url in self._ordered_urls:
+            self._release_card(url)
+        self._ordered_urls.clear()
     
+    @Slot()
     def clear_queue(self):
         """Clear the queue"""
         self.clear_requested.emit()
     
+    @Slot(list, list)
     def update_bandwidth_graph(self, times, values):
         """Update bandwidth graph with new data"""
-        if not times or not values:
+        if not len(times) or not len(values):
             return
             
         # Convert bytes/sec to MB/sec
-        mb_values = [v / (1024 * 1024) for v in values]
+        times = np.asarray(times)
+        mb_values = np.asarray(values, dtype=np.float32) * (1.0 / (1024 * 1024))
+        
+        # Defer the repaint if the graph was drawn less than 100 ms ago
+        elapsed = time.monotonic() - self._last_bw_paint
+        if elapsed < 0.1:
+            self._pending_bw = (times, mb_values)
+            if not self._bw_timer.isActive():
+                self._bw_timer.start(int((0.1 - elapsed) * 1000))
+            return
+        
+        self._paint_bandwidth(times, mb_values)
+    
+    @Slot()
+    def _apply_pending_bandwidth(self):
+        """Draw the most recent bandwidth data held back by the throttle"""
+        if self._pending_bw is not None:
+            times, mb_values = self._pending_bw
+            self._pending_bw = None
+            self._paint_bandwidth(times, mb_values)
+    
+    def _paint_bandwidth(self, times, mb_values):
+        """Push bandwidth data (MB/s) to the graph"""
+        self._last_bw_paint = time.monotonic()
         
         # Update the graph
         self.bandwidth_curve.setData(times, mb_values)
         
-        # Auto scale the graph
-        max_value = max(mb_values) if mb_values else 1
-        self.bandwidth_graph.setYRange(0, max_value * 1.1)
+        # Grow as soon as the peak needs it; shrink only once it falls well below
+        new_max = float(mb_values.max()) * 1.1
+        if new_max > self._y_max or new_max < self._y_max * 0.5:
+            self._y_max = new_max
+            self.bandwidth_graph.setYRange(0, new_max)
         
         # Set nice round X range
-        self.bandwidth_graph.setXRange(min(times), max(times))
+        x_range = (float(times.min()), float(times.max()))
+        if x_range != self._x_range:
+            self._x_range = x_range
+            self.bandwidth_graph.setXRange(*x_range)
     
+    @Slot(dict)
     def set_theme(self, theme):
         """Update theme colors"""
+        # Themes are swapped, never mutated: the same object means nothing to restyle
+        if theme is self.theme:
+            return
         self.theme = theme
         
         # Update title style
-        title = self.findChild(QLabel, "", Qt.FindChildrenRecursively)
-        if title and title.text() == "Download Queue":
-            title.setStyleSheet(f"""
-                font-size: 16px;
-                font-weight: bold;
-                color: {self.theme['text']};
-            """)
+        self.title_label.setStyleSheet(f"""
+            font-size: 16px;
+            font-weight: bold;
+            color: {self.theme['text']};
+        """)
         
         # Update clear button style
         self.clear_btn.setStyleSheet(f"""
@@ -687,6 +977,19 @@ class SmartQueueWidget(QWidget):
             padding: 20px;
         """)
         
+        self.show_more_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: transparent;
+                color: {self.theme['text_secondary']};
+                border: none;
+                font-style: italic;
+                padding: 8px;
+            }}
+            QPushButton:hover {{
+                color: {self.theme['accent']};
+            }}
+        """)
+        
         # Update bandwidth graph
         self.bandwidth_graph.setBackground(self.theme["card"])
         self.bandwidth_curve.setPen(pg.mkPen(color=self.theme["accent"], width=2))
@@ -694,44 +997,45 @@ class SmartQueueWidget(QWidget):
         self.bandwidth_graph.getAxis('bottom').setTextPen(self.theme["text"])
         
         # Update graph title
-        for label in self.graph_container.findChildren(QLabel):
-            if label.text() == "Bandwidth Usage":
-                label.setStyleSheet(f"""
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: {self.theme['text']};
-                    margin-bottom: 5px;
-                """)
-        
-        # Update all queue item cards
-        for card in self.task_widgets.values():
-            card.set_theme(theme)
+        self.graph_title.setStyleSheet(f"""
+            font-size: 14px;
+            font-weight: bold;
+            color: {self.theme['text']};
+            margin-bottom: 5px;
+        """)
+        
+        # Update all queue item cards, repainting the container once
+        self.queue_container.setUpdatesEnabled(False)
+        try:
+            for card in self.task_widgets.values():
+                card.set_theme(theme)
+        finally:
+            self.queue_container.setUpdatesEnabled(True)
         
         # Update scroll area style
-        for scroll in self.findChildren(QScrollArea):
-            scroll.setStyleSheet(f"""
-                QScrollArea {{
-                    background-color: transparent;
-                    border: none;
-                }}
-                QScrollBar:vertical {{
-                    background: {self.theme['primary']};
-                    width: 14px;
-                    margin: 0px;
-                }}
-                QScrollBar::handle:vertical {{
-                    background: {self.theme['secondary']};
-                    min-height: 20px;
-                    border-radius: 7px;
-                    margin: 2px;
-                }}
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                    height: 0px;
-                }}
-                QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {{
-                    height: 0px;
-                }}
-                QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                    background: none;
-                }}
-            """)
+        self.scroll_area.setStyleSheet(f"""
+            QScrollArea {{
+                background-color: transparent;
+                border: none;
+            }}
+            QScrollBar:vertical {{
+                background: {self.theme['primary']};
+                width: 14px;
+                margin: 0px;
+            }}
+            QScrollBar::handle:vertical {{
+                background: {self.theme['secondary']};
+                min-height: 20px;
+                border-radius: 7px;
+                margin: 2px;
+            }}
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+                height: 0px;
+            }}
+            QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {{
+                height: 0px;
+            }}
+            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
+                background: none;
+            }}
+        """)
@@ -1,53 +1,111 @@
 
+from html import escape
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
+    QWidget, QVBoxLayout, QLabel, QProgressBar
 )
 from PySide6.QtCore import Qt
-from typing import Dict
+from typing import Dict, List
 
+from src.constants.theme import DARK_THEME, LIGHT_THEME
 from src.utils.formatting import format_size
 
 
+def _theme_rules(theme: Dict) -> str:
+    """Build the rules applied while the widget's theme property matches the theme"""
+    # Bind the colors once instead of indexing the theme for every rule
+    text = theme['text']
+    border = theme['border']
+    secondary = theme['secondary']
+    accent = theme['accent']
+    scope = f'StorageInfoWidget[theme="{theme["name"]}"]'
+    return f"""
+        {scope} QLabel#storageTitle {{
+            font-size: 16px;
+            font-weight: bold;
+            color: {text};
+        }}
+        {scope} QProgressBar#storageUsageBar {{
+            border: 1px solid {border};
+            border-radius: 4px;
+            background-color: {secondary};
+            color: {text};
+            text-align: center;
+            height: 24px;
+        }}
+        {scope} QProgressBar#storageUsageBar::chunk {{
+            background-color: {accent};
+            border-radius: 3px;
+        }}
+        {scope} QLabel#storageUsageLabel, {scope} QLabel#storageCategoryRow {{
+            color: {text};
+        }}
+        {scope} QLabel#storageBreakdownTitle {{
+            font-size: 14px;
+            font-weight: bold;
+            margin-top: 16px;
+            color: {text};
+        }}
+    """
+
+
+# Rules for every theme, parsed once; set_theme only flips the theme property
+_STYLESHEET = "".join(_theme_rules(theme) for theme in (DARK_THEME, LIGHT_THEME))
+
+
 class StorageInfoWidget(QWidget):
     """Widget for displaying storage usage information"""
     
     def __init__(self, theme: Dict, parent=None):
         super().__init__(parent)
         self.theme = theme
-        self.init_ui()
+        
+        # Breakdown rows by category, reused across updates
+        self._rows: Dict[str, QLabel] = {}
+        self._row_sizes: Dict[str, str] = {}  # formatted size shown by each row
+        self._row_order: List[str] = []  # categories of the visible rows, largest first
+        
+        # Widgets styled by the theme rules, re-polished by set_theme
+        self._themed_widgets: List[QWidget] = []
+        
+        # The UI is built on first show; updates received before that are kept
+        self._built = False
+        self._pending_usage = None
+        self._last_usage = None  # (total, free, categories) currently displayed
+    
+    def showEvent(self, event):
+        """Build the UI the first time the widget is shown"""
+        if not self._built:
+            self._built = True
+            self.init_ui()
+            if self._pending_usage is not None:
+                self.update_usage(*self._pending_usage)
+                self._pending_usage = None
+        super().showEvent(event)
     
     def init_ui(self):
         """Initialize UI components"""
         layout = QVBoxLayout(self)
         
+        # One sheet styles every child through object-name selectors
+        self.setProperty("theme", self.theme["name"])
+        self.setStyleSheet(_STYLESHEET)
+        
         # Storage usage title
         title = QLabel("Storage Usage")
-        title.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {self.theme['text']};")
+        title.setObjectName("storageTitle")
         layout.addWidget(title)
         
         # Storage usage bar
         self.usage_layout = QVBoxLayout()
         self.usage_bar = QProgressBar()
+        self.usage_bar.setObjectName("storageUsageBar")
         self.usage_bar.setRange(0, 100)
         self.usage_bar.setValue(0)
         self.usage_bar.setTextVisible(True)
-        self.usage_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {self.theme['border']};
-                border-radius: 4px;
-                background-color: {self.theme['secondary']};
-                color: {self.theme['text']};
-                text-align: center;
-                height: 24px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['accent']};
-                border-radius: 3px;
-            }}
-        """)
         
         self.usage_label = QLabel("0 B / 0 B (0%)")
-        self.usage_label.setStyleSheet(f"color: {self.theme['text']};")
+        self.usage_label.setObjectName("storageUsageLabel")
         self.usage_layout.addWidget(self.usage_bar)
         self.usage_layout.addWidget(self.usage_label)
         
@@ -55,7 +113,7 @@ class StorageInfoWidget(QWidget):
         
         # Model type breakdown
         self.breakdown_title = QLabel("Model Type Breakdown")
-        self.breakdown_title.setStyleSheet(f"font-size: 14px; font-weight: bold; margin-top: 16px; color: {self.theme['text']};")
+        self.breakdown_title.setObjectName("storageBreakdownTitle")
         layout.addWidget(self.breakdown_title)
         
         # Breakdown list
@@ -67,9 +125,32 @@ class StorageInfoWidget(QWidget):
         
         # Add stretch to push everything to the top
         layout.addStretch()
+        
+        self._themed_widgets = [
+            self, title, self.usage_bar, self.usage_label, self.breakdown_title
+        ]
     
     def update_usage(self, total_size: int, free_size: int, categories: Dict[str, int]):
         """Update storage usage information"""
+        if not self._built:
+            self._pending_usage = (total_size, free_size, categories)
+            return
+        
+        # Nothing to redraw when the numbers did not change
+        usage = (total_size, free_size, dict(categories))
+        if usage == self._last_usage:
+            return
+        self._last_usage = usage
+        
+        # Suspend painting so every bar and label change results in a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_usage(total_size, free_size, categories)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _update_usage(self, total_size: int, free_size: int, categories: Dict[str, int]):
+        """Apply a storage update; called with updates disabled"""
         # Calculate usage percentage
         used_size = total_size - free_size
         if total_size > 0:
@@ -85,74 +166,69 @@ class StorageInfoWidget(QWidget):
             f"{format_size(used_size)} / {format_size(total_size)} ({percentage:.1f}%)"
         )
         
-        # Clear breakdown layout
-        while self.breakdown_layout.count():
-            item = self.breakdown_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add category items
+        # Update rows in place; only new categories get widgets
+        order = []
         for category, size in sorted(categories.items(), key=lambda x: x[1], reverse=True):
             if size == 0:
                 continue
-                
-            # Create layout for this category
-            item_layout = QHBoxLayout()
-            
-            # Create label with category name
-            name_label = QLabel(category)
-            name_label.setStyleSheet(f"color: {self.theme['text']};")
-            
-            # Create label with size
-            size_label = QLabel(format_size(size))
-            size_label.setStyleSheet(f"color: {self.theme['text_secondary']}; text-align: right;")
-            size_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
             
-            # Add to item layout
-            item_layout.addWidget(name_label)
-            item_layout.addWidget(size_label)
-            
-            # Add to breakdown layout
-            self.breakdown_layout.addLayout(item_layout)
+            row = self._rows.get(category)
+            if row is None:
+                row = self._rows[category] = self.create_row()
+            size_text = format_size(size)
+            if self._row_sizes.get(category) != size_text:
+                self._row_sizes[category] = size_text
+                row.setText(self.row_html(category, size_text))
+            row.setVisible(True)
+            order.append(category)
+        
+        # Hide (rather than destroy) rows for categories that dropped out
+        shown = set(order)
+        for category, row in self._rows.items():
+            if category not in shown:
+                row.setVisible(False)
+        
+        # Move rows only when the size order changed
+        if order != self._row_order:
+            for i, category in enumerate(order):
+                row = self._rows[category]
+                self.breakdown_layout.removeWidget(row)
+                self.breakdown_layout.insertWidget(i, row)
+            self._row_order = order
+    
+    def create_row(self) -> QLabel:
+        """Create a breakdown row; name and size share one rich text label"""
+        row = QLabel()
+        row.setObjectName("storageCategoryRow")
+        row.setTextFormat(Qt.RichText)
+        
+        # Add to breakdown layout
+        self.breakdown_layout.addWidget(row)
+        self._themed_widgets.append(row)
+        
+        return row
+    
+    def row_html(self, category: str, size_text: str) -> str:
+        """Build the rich text of a breakdown row"""
+        return (
+            "<table width='100%' cellspacing='0' cellpadding='0'><tr>"
+            f"<td>{escape(category)}</td>"
+            f"<td align='right' style='color: {self.theme['text_secondary']};'>{size_text}</td>"
+            "</tr></table>"
+        )
     
     def set_theme(self, theme):
         """Update theme"""
         self.theme = theme
-        
-        # Update styles
-        title = self.findChild(QLabel, "", Qt.FindDirectChildrenOnly)
-        if title:
-            title.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {self.theme['text']};")
-        
-        self.usage_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {self.theme['border']};
-                border-radius: 4px;
-                background-color: {self.theme['secondary']};
-                color: {self.theme['text']};
-                text-align: center;
-                height: 24px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['accent']};
-                border-radius: 3px;
-            }}
-        """)
-        
-        self.usage_label.setStyleSheet(f"color: {self.theme['text']};")
-        
-        self.breakdown_title.setStyleSheet(
-            f"font-size: 14px; font-weight: bold; margin-top: 16px; color: {self.theme['text']};"
-        )
-        
-        # Update all category labels
-        for i in range(self.breakdown_layout.count()):
-            layout_item = self.breakdown_layout.itemAt(i)
-            if isinstance(layout_item, QHBoxLayout):
-                for j in range(layout_item.count()):
-                    widget = layout_item.itemAt(j).widget()
-                    if isinstance(widget, QLabel):
-                        if j == 0:  # Name label
-                            widget.setStyleSheet(f"color: {self.theme['text']};")
-                        else:  # Size label
-                            widget.setStyleSheet(f"color: {self.theme['text_secondary']}; text-align: right;")
+        if not self._built:
+            return  # init_ui picks up the theme
+        
+        # Re-match the already parsed rules instead of installing a new sheet
+        self.setProperty("theme", self.theme["name"])
+        for widget in self._themed_widgets:
+            widget.style().polish(widget)
+            widget.update()
+        
+        # Row sizes carry their color inline
+        for category, row in self._rows.items():
+            row.setText(self.row_html(category, self._row_sizes[category]))
@@ -1,51 +1,146 @@
-from typing import Dict
+from typing import Dict, List
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QProgressBar, QGroupBox
 )
 
+from src.constants.theme import DARK_THEME, LIGHT_THEME
 from src.utils.formatting import format_size
 
+# Chunk color of each category bar, in display order
+CATEGORY_COLORS = {
+    "LoRAs": "#5b9bd5",
+    "Checkpoints": "#ed7d31",
+    "Embeddings": "#70ad47",
+    "Other": "#7030a0",
+}
+
+
+def _theme_rules(theme: Dict) -> str:
+    """Build the rules applied while the widget's theme property matches the theme"""
+    # Bind the colors once instead of indexing the theme for every rule
+    text = theme['text']
+    border = theme['border']
+    input_bg = theme['input_bg']
+    accent = theme['accent']
+    accent_hover = theme['accent_hover']
+    scope = f'StorageUsageWidget[theme="{theme["name"]}"]'
+    category_rules = "".join(
+        f"""
+        {scope} QProgressBar#storageCategoryBar[category="{category}"]::chunk {{
+            background-color: {color};
+        }}"""
+        for category, color in CATEGORY_COLORS.items()
+    )
+    return f"""
+        {scope} QLabel#storageTitle {{
+            font-size: 16px;
+            font-weight: bold;
+            color: {text};
+        }}
+        {scope} QLabel#storageUsageDetails, {scope} QLabel#storageCategoryName {{
+            color: {text};
+        }}
+        {scope} QProgressBar#storageUsageBar {{
+            border: 1px solid {border};
+            border-radius: 5px;
+            text-align: center;
+            height: 25px;
+            color: {text};
+            background-color: {input_bg};
+        }}
+        {scope} QProgressBar#storageUsageBar::chunk {{
+            background-color: {accent};
+            border-radius: 5px;
+        }}
+        {scope} QProgressBar#storageCategoryBar {{
+            border: 1px solid {border};
+            border-radius: 3px;
+            text-align: center;
+            height: 18px;
+            color: {text};
+            background-color: {input_bg};
+        }}
+        {scope} QProgressBar#storageCategoryBar::chunk {{
+            border-radius: 3px;
+        }}{category_rules}
+        {scope} QPushButton#storageRefreshButton {{
+            background-color: {accent};
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 8px;
+        }}
+        {scope} QPushButton#storageRefreshButton:hover {{
+            background-color: {accent_hover};
+        }}
+        {scope} QGroupBox#storageGroup {{
+            border: 1px solid {border};
+            border-radius: 8px;
+            margin-top: 1ex;
+            font-weight: bold;
+            color: {text};
+        }}
+        {scope} QGroupBox#storageGroup::title {{
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 5px;
+        }}
+    """
+
+
+# Rules for every theme, parsed once; set_theme only flips the theme property
+_STYLESHEET = "".join(_theme_rules(theme) for theme in (DARK_THEME, LIGHT_THEME))
+
+
 class StorageUsageWidget(QWidget):
     """Widget for displaying storage usage information"""
     
     def __init__(self, theme: Dict, parent=None):
         super().__init__(parent)
         self.theme = theme
-        self.init_ui()
+        # Widgets styled by the theme rules, re-polished by set_theme
+        self._themed_widgets: List[QWidget] = []
+        
+        # The UI is built on first show; updates received before that are kept
+        self._built = False
+        self._pending_usage = None
+        self._last_usage = None  # (total, free, categories) currently displayed
+        self._refresh_target = None  # ancestor providing refresh_storage_analysis
+    
+    def showEvent(self, event):
+        """Build the UI the first time the widget is shown"""
+        if not self._built:
+            self._built = True
+            self.init_ui()
+            if self._pending_usage is not None:
+                self.update_usage(*self._pending_usage)
+                self._pending_usage = None
+        super().showEvent(event)
     
     def init_ui(self):
         """Initialize UI components"""
         layout = QVBoxLayout(self)
         
+        # One sheet styles every child through object-name selectors
+        self.setProperty("theme", self.theme["name"])
+        self.setStyleSheet(_STYLESHEET)
+        
         # Title
         title = QLabel("Storage Usage")
-        title.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {self.theme['text']};")
+        title.setObjectName("storageTitle")
         layout.addWidget(title)
         
         # Storage usage bar
         self.usage_bar = QProgressBar()
+        self.usage_bar.setObjectName("storageUsageBar")
         self.usage_bar.setTextVisible(True)
-        self.usage_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {self.theme['border']};
-                border-radius: 5px;
-                text-align: center;
-                height: 25px;
-                color: {self.theme['text']};
-                background-color: {self.theme['input_bg']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['accent']};
-                border-radius: 5px;
-            }}
-        """)
         layout.addWidget(self.usage_bar)
         
         # Usage details
         self.usage_details = QLabel()
-        self.usage_details.setStyleSheet(f"color: {self.theme['text']};")
+        self.usage_details.setObjectName("storageUsageDetails")
         layout.addWidget(self.usage_details)
         
         # Category breakdown
@@ -53,163 +148,76 @@ class StorageUsageWidget(QWidget):
         category_layout = QVBoxLayout(category_group)
         
         self.category_bars = {}
-        for category, color in [
-            ("LoRAs", "#5b9bd5"), 
-            ("Checkpoints", "#ed7d31"), 
-            ("Embeddings", "#70ad47"), 
-            ("Other", "#7030a0")
-        ]:
+        for category in CATEGORY_COLORS:
             cat_layout = QHBoxLayout()
             cat_label = QLabel(category)
+            cat_label.setObjectName("storageCategoryName")
             cat_label.setFixedWidth(100)
-            cat_label.setStyleSheet(f"color: {self.theme['text']};")
             cat_bar = QProgressBar()
+            cat_bar.setObjectName("storageCategoryBar")
+            cat_bar.setProperty("category", category)
             cat_bar.setTextVisible(True)
-            cat_bar.setStyleSheet(f"""
-                QProgressBar {{
-                    border: 1px solid {self.theme['border']};
-                    border-radius: 3px;
-                    text-align: center;
-                    height: 18px;
-                    color: {self.theme['text']};
-                    background-color: {self.theme['input_bg']};
-                }}
-                QProgressBar::chunk {{
-                    background-color: {color};
-                    border-radius: 3px;
-                }}
-            """)
                 
             cat_layout.addWidget(cat_label)
             cat_layout.addWidget(cat_bar)
             category_layout.addLayout(cat_layout)
             
             self.category_bars[category] = cat_bar
+            self._themed_widgets += [cat_label, cat_bar]
         
         layout.addWidget(category_group)
         
         # Refresh button
         refresh_btn = QPushButton("Refresh Storage Analysis")
-        refresh_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['accent']};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['accent_hover']};
-            }}
-        """)
+        refresh_btn.setObjectName("storageRefreshButton")
         refresh_btn.clicked.connect(self.refresh_requested)
         layout.addWidget(refresh_btn)
         
         layout.addStretch()
+        
+        self._themed_widgets += [
+            self, title, self.usage_bar, self.usage_details, category_group, refresh_btn
+        ]
     
     def create_styled_group_box(self, title):
         """Create a styled group box"""
         group = QGroupBox(title)
-        group.setStyleSheet(f"""
-            QGroupBox {{
-                border: 1px solid {self.theme['border']};
-                border-radius: 8px;
-                margin-top: 1ex;
-                font-weight: bold;
-                color: {self.theme['text']};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }}
-        """)
+        group.setObjectName("storageGroup")
         return group
     
     def set_theme(self, theme):
         """Update the theme"""
         self.theme = theme
+        if not self._built:
+            return  # init_ui picks up the theme
         
-        # Update title
-        for child in self.findChildren(QLabel):
-            if "font-size: 16px" in child.styleSheet():
-                child.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {self.theme['text']};")
-            else:
-                child.setStyleSheet(f"color: {self.theme['text']};")
-        
-        # Update usage bar
-        self.usage_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {self.theme['border']};
-                border-radius: 5px;
-                text-align: center;
-                height: 25px;
-                color: {self.theme['text']};
-                background-color: {self.theme['input_bg']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.theme['accent']};
-                border-radius: 5px;
-            }}
-        """)
-        
-        # Update category bars
-        for category, color in [
-            ("LoRAs", "#5b9bd5"), 
-            ("Checkpoints", "#ed7d31"), 
-            ("Embeddings", "#70ad47"), 
-            ("Other", "#7030a0")
-        ]:
-            if category in self.category_bars:
-                self.category_bars[category].setStyleSheet(f"""
-                    QProgressBar {{
-                        border: 1px solid {self.theme['border']};
-                        border-radius: 3px;
-                        text-align: center;
-                        height: 18px;
-                        color: {self.theme['text']};
-                        background-color: {self.theme['input_bg']};
-                    }}
-                    QProgressBar::chunk {{
-                        background-color: {color};
-                        border-radius: 3px;
-                    }}
-                """)
-        
-        # Update refresh button
-        for child in self.findChildren(QPushButton):
-            child.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {self.theme['accent']};
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 8px;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.theme['accent_hover']};
-                }}
-            """)
-        
-        # Update group boxes
-        for child in self.findChildren(QGroupBox):
-            child.setStyleSheet(f"""
-                QGroupBox {{
-                    border: 1px solid {self.theme['border']};
-                    border-radius: 8px;
-                    margin-top: 1ex;
-                    font-weight: bold;
-                    color: {self.theme['text']};
-                }}
-                QGroupBox::title {{
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                }}
-            """)
+        # Re-match the already parsed rules instead of installing a new sheet
+        self.setProperty("theme", self.theme["name"])
+        for widget in self._themed_widgets:
+            widget.style().polish(widget)
+            widget.update()
     
     def update_usage(self, total_size, free_size, category_sizes):
         """Update the storage usage display"""
+        if not self._built:
+            self._pending_usage = (total_size, free_size, category_sizes)
+            return
+        
+        # Nothing to redraw when the numbers did not change
+        usage = (total_size, free_size, dict(category_sizes))
+        if usage == self._last_usage:
+            return
+        self._last_usage = usage
+        
+        # Suspend painting so every bar and label change results in a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_usage(total_size, free_size, category_sizes)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _update_usage(self, total_size, free_size, category_sizes):
+        """Apply a storage update; called with updates disabled"""
         used_size = total_size - free_size
         usage_percent = int((used_size / total_size) * 100) if total_size > 0 else 0
         
@@ -221,16 +229,20 @@ class StorageUsageWidget(QWidget):
         
         # Update category bars
         for category, size in category_sizes.items():
-            if category in self.category_bars:
+            bar = self.category_bars.get(category)
+            if bar is not None:
                 percent = int((size / total_size) * 100) if total_size > 0 else 0
-                self.category_bars[category].setValue(percent)
-                self.category_bars[category].setFormat(f"{percent}% ({format_size(size)})")
+                bar.setValue(percent)
+                bar.setFormat(f"{percent}% ({format_size(size)})")
     
     def refresh_requested(self):
         """Signal to parent to refresh storage analysis"""
-        parent = self.parent()
-        while parent and not hasattr(parent, "refresh_storage_analysis"):
-            parent = parent.parent()
+        # Walk up the parent chain only once; the ancestor is kept for later clicks
+        if self._refresh_target is None:
+            parent = self.parent()
+            while parent and not hasattr(parent, "refresh_storage_analysis"):
+                parent = parent.parent()
+            self._refresh_target = parent
             
-        if parent and hasattr(parent, "refresh_storage_analysis"):
-            parent.refresh_storage_analysis()
\ No newline at end of file
+        if self._refresh_target:
+            self._refresh_target.refresh_storage_analysis()
\ No newline at end of file
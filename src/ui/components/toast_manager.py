@@ -1,16 +1,84 @@
 
+import time
+from collections import OrderedDict
+from html import escape
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QGraphicsOpacityEffect
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QApplication
 )
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QRect
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt, Slot, QAbstractAnimation, QEvent, QTimer, QPropertyAnimation, QEasingCurve, QPoint, QRect
+from PySide6.QtGui import QColor, QPainter, QPixmap
+
+from typing import Dict, List, Optional, Callable, Tuple
+
+# Parent events after which the toast stack must be repositioned
+_REPOSITION_EVENTS = (QEvent.Show, QEvent.WindowStateChange, QEvent.Move, QEvent.Resize)
+
+# Fade duration in milliseconds
+FADE_DURATION = 300
+
+# Hidden toasts kept around for reuse by later notifications
+MAX_POOLED_TOASTS = 5
+
+# Installed once on the manager and inherited by every toast it parents, so it is
+# parsed once rather than per toast; toast backgrounds are painted in paintEvent
+_STYLESHEET = """
+    * {
+        background: transparent;
+    }
+    QLabel#toastMessage {
+        color: white;
+    }
+    QPushButton#toastCloseButton {
+        background-color: transparent;
+        color: white;
+        border: none;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton#toastCloseButton:hover {
+        color: rgba(255, 255, 255, 0.8);
+    }
+    QPushButton#toastActionButton {
+        background-color: rgba(255, 255, 255, 0.2);
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 5px 10px;
+    }
+    QPushButton#toastActionButton:hover {
+        background-color: rgba(255, 255, 255, 0.3);
+    }
+"""
+
+# Background colors keyed by (id(theme), type); themes are module-level singletons
+_BG_COLORS: Dict[Tuple[int, str], QColor] = {}
+
+
+def _background_qcolor(theme: Dict, type_: str, color: str) -> QColor:
+    """Get the shared background QColor of a toast type, creating it only once"""
+    key = (id(theme), type_)
+    qcolor = _BG_COLORS.get(key)
+    if qcolor is None:
+        qcolor = _BG_COLORS[key] = QColor(color)
+    return qcolor
+
+
+def _fade_duration() -> int:
+    """Get the fade duration, or 0 when the app's reduce_motion property is set"""
+    app = QApplication.instance()
+    return 0 if app is not None and app.property("reduce_motion") else FADE_DURATION
 
-from typing import Dict, Optional, Callable
 
 class ToastNotification(QWidget):
     """A single toast notification widget"""
     
+    # Notification types resolve to an index once (unknown types show as info);
+    # the index selects the theme color key and icon text
+    _TYPE_IDS = {"success": 0, "error": 1, "warning": 2, "info": 3}
+    _THEME_KEYS = ("success", "danger", "warning", "info")
+    _ICONS = ("✓", "✕", "!", "i")
+    
     def __init__(self, message: str, type_: str, theme: Dict, 
                 duration: int = 3000, parent=None, 
                 action: Optional[Callable] = None,
@@ -19,6 +87,7 @@ class ToastNotification(QWidget):
         self.theme = theme
         self.message = message
         self.type = type_
+        self._type_id = self._TYPE_IDS.get(type_, 3)
         self.duration = duration
         self.action_callback = action
         self.action_text = action_text or "Action"
@@ -32,11 +101,15 @@ class ToastNotification(QWidget):
         
         # Set background color based on type
         self.background_color = self.get_background_color()
+        self._bg_color = _background_qcolor(self.theme, self.type, self.background_color)
+        self._bg_pixmap = None  # background rendered at the current size
+        self._cached_width = None  # width the cached height was measured at
+        self._cached_height = None  # layout height for the current content
+        self.close_deadline = None  # time.monotonic() at which ToastManager auto-closes it
         
-        # Create opacity effect
-        self.opacity_effect = QGraphicsOpacityEffect()
-        self.opacity_effect.setOpacity(0.0)
-        self.setGraphicsEffect(self.opacity_effect)
+        # Fade through the window opacity, which the compositor applies without
+        # re-rendering the toast offscreen every frame
+        self.setWindowOpacity(0.0)
         
         self.init_ui()
         self.setup_animations()
@@ -46,151 +119,175 @@ class ToastNotification(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
         
-        # Message
+        # Message, with the icon rendered inline as rich text
         message_layout = QHBoxLayout()
         message_layout.setSpacing(10)
         
-        # Icon
-        if self.type == "success":
-            icon = "✓"
-        elif self.type == "error":
-            icon = "✕"
-        elif self.type == "warning":
-            icon = "!"
-        else:
-            icon = "i"
-        
-        icon_label = QLabel(icon)
-        icon_label.setStyleSheet(f"""
-            color: white;
-            font-size: 14px;
-            font-weight: bold;
-        """)
-        
-        # Message text
-        message_label = QLabel(self.message)
-        message_label.setWordWrap(True)
-        message_label.setStyleSheet("color: white;")
+        self.message_label = QLabel(self.message_html())
+        self.message_label.setTextFormat(Qt.RichText)
+        self.message_label.setWordWrap(True)
+        self.message_label.setObjectName("toastMessage")
         
-        message_layout.addWidget(icon_label, 0)
-        message_layout.addWidget(message_label, 1)
+        message_layout.addWidget(self.message_label, 1)
         
         # Close button
         close_button = QPushButton("×")
         close_button.setFixedSize(20, 20)
-        close_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: white;
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                color: rgba(255, 255, 255, 0.8);
-            }}
-        """)
-        close_button.clicked.connect(self.close_animation)
+        close_button.setObjectName("toastCloseButton")
+        close_button.clicked.connect(self.close_animation, Qt.DirectConnection)
         
         message_layout.addWidget(close_button, 0)
         
         # Add message layout
         layout.addLayout(message_layout)
         
-        # Add action button if provided
+        # Action row, built only once a toast actually carries an action
+        self.action_row = None
+        self.action_button = None
         if self.action_callback:
-            action_layout = QHBoxLayout()
-            action_layout.setContentsMargins(0, 10, 0, 0)
-            
-            action_button = QPushButton(self.action_text)
-            action_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: rgba(255, 255, 255, 0.2);
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 5px 10px;
-                }}
-                QPushButton:hover {{
-                    background-color: rgba(255, 255, 255, 0.3);
-                }}
-            """)
-            action_button.clicked.connect(self.execute_action)
-            
-            action_layout.addStretch()
-            action_layout.addWidget(action_button)
-            
-            layout.addLayout(action_layout)
-        
-        # Set widget style
-        self.setStyleSheet(f"""
-            ToastNotification {{
-                background-color: {self.background_color};
-                border-radius: 6px;
-            }}
-        """)
+            self.build_action_row()
+    
+    def build_action_row(self):
+        """Create the action button row below the message"""
+        self.action_row = QWidget()
+        action_layout = QHBoxLayout(self.action_row)
+        action_layout.setContentsMargins(0, 10, 0, 0)
+        
+        self.action_button = QPushButton(self.action_text)
+        self.action_button.setObjectName("toastActionButton")
+        self.action_button.clicked.connect(self.execute_action, Qt.DirectConnection)
+        
+        action_layout.addStretch()
+        action_layout.addWidget(self.action_button)
+        
+        self.layout().addWidget(self.action_row)
+    
+    def reset(self, message: str, type_: str, theme: Dict, duration: int = 3000,
+              action: Optional[Callable] = None, action_text: Optional[str] = None):
+        """Reuse this toast for a new notification"""
+        self.message = message
+        self.duration = duration
+        self.action_callback = action
+        self.action_text = action_text or "Action"
+        
+        # Restyle only when the look actually changed
+        if type_ != self.type or theme is not self.theme:
+            self.type = type_
+            self._type_id = self._TYPE_IDS.get(type_, 3)
+            self.theme = theme
+            self.background_color = self.get_background_color()
+            self._bg_color = _background_qcolor(self.theme, self.type, self.background_color)
+            self._bg_pixmap = None
+        
+        self._cached_height = None
+        self.message_label.setText(self.message_html())
+        if self.action_row is not None:
+            self.action_button.setText(self.action_text)
+            self.action_row.setVisible(self.action_callback is not None)
+        elif self.action_callback:
+            self.build_action_row()
+        
+        # Start from the hidden state of a fresh toast
+        self.fade_out.stop()
+        self.setWindowOpacity(0.0)
+        self.close_deadline = None
+    
+    def height_for_width(self, width: int) -> int:
+        """Get the toast height at a width, measuring the layout only after a change"""
+        if self._cached_height is None or width != self._cached_width:
+            self._cached_width = width
+            self._cached_height = self.sizeHint().height()
+        return self._cached_height
+    
+    def message_html(self) -> str:
+        """Get the icon and escaped message as a single rich-text string"""
+        return (
+            f'<span style="font-size: 14px; font-weight: bold;">{self.get_icon()}</span>'
+            f'&nbsp;&nbsp;{escape(self.message)}'
+        )
+    
+    def get_icon(self) -> str:
+        """Get icon text based on notification type"""
+        return self._ICONS[self._type_id]
     
     def get_background_color(self) -> str:
         """Get background color based on notification type"""
-        if self.type == "success":
-            return self.theme["success"]
-        elif self.type == "error":
-            return self.theme["danger"]
-        elif self.type == "warning":
-            return self.theme["warning"]
-        else:
-            return self.theme["info"]
+        return self.theme[self._THEME_KEYS[self._type_id]]
     
     def setup_animations(self):
         """Set up fade animations"""
         # Fade in animation
-        self.fade_in = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.fade_in.setDuration(300)
+        self.fade_in = QPropertyAnimation(self, b"windowOpacity")
+        self.fade_in.setDuration(FADE_DURATION)
         self.fade_in.setStartValue(0.0)
         self.fade_in.setEndValue(1.0)
         self.fade_in.setEasingCurve(QEasingCurve.OutCubic)
         
         # Fade out animation
-        self.fade_out = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.fade_out.setDuration(300)
+        self.fade_out = QPropertyAnimation(self, b"windowOpacity")
+        self.fade_out.setDuration(FADE_DURATION)
         self.fade_out.setStartValue(1.0)
         self.fade_out.setEndValue(0.0)
         self.fade_out.setEasingCurve(QEasingCurve.OutCubic)
-        self.fade_out.finished.connect(self.close)
-        
-        # Auto close timer
-        self.timer = QTimer(self)
-        self.timer.setSingleShot(True)
-        self.timer.setInterval(self.duration)
-        self.timer.timeout.connect(self.close_animation)
+        self.fade_out.finished.connect(self.close, Qt.DirectConnection)
     
     def show_animation(self):
         """Show the notification with animation"""
+        # A zero duration fade applies its end value at once, without any frames
+        self.fade_in.setDuration(_fade_duration())
         self.fade_in.start()
         self.show()
-        self.timer.start()
+        
+        # Auto close is driven by the manager's shared timer
+        self.close_deadline = time.monotonic() + self.duration / 1000
     
+    @Slot()
     def close_animation(self):
         """Close the notification with animation"""
-        self.timer.stop()
+        self.close_deadline = None
+        self.fade_out.setDuration(_fade_duration())
         self.fade_out.start()
     
+    @Slot()
     def execute_action(self):
         """Execute the action callback"""
         if self.action_callback:
             self.action_callback()
             self.close_animation()
     
+    def render_background(self) -> QPixmap:
+        """Render the rounded toast background at the current size"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._bg_color)
+        painter.drawRoundedRect(self.rect(), 6, 6)
+        painter.end()
+        return pixmap
+    
+    def resizeEvent(self, event):
+        """Drop the background rendered for the old size"""
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+    
+    def paintEvent(self, event):
+        """Paint the cached rounded background"""
+        if self._bg_pixmap is None:
+            self._bg_pixmap = self.render_background()
+        QPainter(self).drawPixmap(0, 0, self._bg_pixmap)
+    
     def set_theme(self, theme):
         """Update theme"""
         self.theme = theme
         self.background_color = self.get_background_color()
-        self.setStyleSheet(f"""
-            ToastNotification {{
-                background-color: {self.background_color};
-                border-radius: 6px;
-            }}
-        """)
+        self._bg_color = _background_qcolor(self.theme, self.type, self.background_color)
+        self._bg_pixmap = None
+        self.update()
 
 
 class ToastManager(QWidget):
@@ -201,12 +298,33 @@ class ToastManager(QWidget):
         self.theme = theme or {}
         self.toast_spacing = 10
         self.toast_margin = 20
-        self.active_toasts = []
+        self.max_active = 5  # older toasts are closed early beyond this many
+        self.active_toasts: "OrderedDict[int, ToastNotification]" = OrderedDict()  # by id(toast), oldest first
+        self._pool: List[ToastNotification] = []
+        
+        # Toasts waiting to be shown, oldest first: (message, type, duration, action, action_text)
+        self._pending: List[Tuple] = []
+        self._flush_scheduled = False
+        
+        # Repositioning requests made in one event loop pass collapse into one pass
+        self._reposition_timer = QTimer(self)
+        self._reposition_timer.setSingleShot(True)
+        self._reposition_timer.setInterval(0)
+        self._reposition_timer.timeout.connect(self._do_position_toasts, Qt.DirectConnection)
+        
+        # One timer auto-closes every toast, armed for the earliest deadline
+        self._close_timer = QTimer(self)
+        self._close_timer.setSingleShot(True)
+        self._close_timer.timeout.connect(self._close_expired, Qt.DirectConnection)
+        
+        # Positioning is skipped while the parent is hidden; catch it coming back
+        if parent is not None:
+            parent.installEventFilter(self)
         
         # Make widget transparent and frameless
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setAttribute(Qt.WA_NoSystemBackground)
-        self.setStyleSheet("background: transparent;")
+        self.setStyleSheet(_STYLESHEET)
     
     def show_toast(self, message: str, type_: str = "info", duration: int = 3000,
                   action: Optional[Callable] = None, action_text: Optional[str] = None):
@@ -219,60 +337,151 @@ class ToastManager(QWidget):
             action: Optional callback function to execute when action button is clicked
             action_text: Optional text for the action button
         """
-        # Create toast notification
-        toast = ToastNotification(
-            message, 
-            type_,
-            self.theme,
-            duration,
-            self,
-            action,
-            action_text
-        )
+        # Coalesce bursts: every toast requested in this event loop pass is shown together
+        self._pending.append((message, type_, duration, action, action_text))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self.flush_pending)
+    
+    @Slot()
+    def flush_pending(self):
+        """Show requested toasts with a single positioning pass"""
+        self._flush_scheduled = False
+        
+        # A burst larger than the stack leaves the rest queued until slots free up
+        count = min(len(self._pending), self.max_active)
+        
+        # Start closing the oldest toasts that would exceed the limit
+        excess = len(self.active_toasts) + count - self.max_active
+        for toast in list(self.active_toasts.values()):
+            if excess <= 0:
+                break
+            if toast.fade_out.state() != QAbstractAnimation.Running:
+                toast.close_animation()
+            excess -= 1
+        
+        self._show_pending(count)
+    
+    def _show_pending(self, count: int):
+        """Show the oldest queued toasts"""
+        pending, self._pending = self._pending[:count], self._pending[count:]
+        if not pending:
+            return
+        
+        toasts = [self.take_toast(*args) for args in pending]
         
         # Add to active toasts
-        self.active_toasts.append(toast)
+        for toast in toasts:
+            self.active_toasts[id(toast)] = toast
         
-        # Position the toast
-        self.position_toasts()
+        # Position all toasts now, so they fade in at their final place
+        self._do_position_toasts()
         
         # Show with animation
-        toast.show_animation()
-        
-        # Connect close signal
-        toast.fade_out.finished.connect(lambda: self.remove_toast(toast))
+        for toast in toasts:
+            toast.show_animation()
+        self._schedule_auto_close()
+    
+    def _schedule_auto_close(self):
+        """Arm the shared close timer for the earliest toast deadline"""
+        deadlines = [
+            toast.close_deadline for toast in self.active_toasts.values()
+            if toast.close_deadline is not None
+        ]
+        if not deadlines:
+            self._close_timer.stop()
+            return
+        delay = min(deadlines) - time.monotonic()
+        self._close_timer.start(max(0, int(delay * 1000)))
+    
+    @Slot()
+    def _close_expired(self):
+        """Close every toast whose display time is up"""
+        now = time.monotonic()
+        for toast in list(self.active_toasts.values()):
+            if toast.close_deadline is not None and toast.close_deadline <= now:
+                toast.close_animation()
+        self._schedule_auto_close()
+    
+    def take_toast(self, message: str, type_: str, duration: int,
+                   action: Optional[Callable], action_text: Optional[str]) -> ToastNotification:
+        """Reuse a hidden toast, or create one"""
+        if self._pool:
+            toast = self._pool.pop()
+            toast.reset(message, type_, self.theme, duration, action, action_text)
+        else:
+            toast = ToastNotification(
+                message, 
+                type_,
+                self.theme,
+                duration,
+                self,
+                action,
+                action_text
+            )
+            toast.fade_out.finished.connect(self._on_toast_fade_out_finished, Qt.DirectConnection)
+        return toast
     
     def position_toasts(self):
+        """Schedule repositioning of all toast notifications"""
+        self._reposition_timer.start()
+    
+    @Slot()
+    def _do_position_toasts(self):
         """Position all toast notifications"""
-        if not self.parent():
+        self._reposition_timer.stop()
+        parent = self.parent()
+        if not parent or not parent.isVisible() or parent.isMinimized():
             return
             
-        # Get parent size
-        parent_rect = self.parent().rect()
+        # Toasts are top-level windows, so work in global coordinates
+        origin = parent.mapToGlobal(QPoint(0, 0))
+        parent_width = parent.width()
+        
+        # Width and x are the same for every toast in the pass
+        toast_width = min(400, parent_width - 2 * self.toast_margin)
+        x = origin.x() + parent_width - toast_width - self.toast_margin
         
         # Position toasts from bottom up
-        y = parent_rect.height() - self.toast_margin
+        y = origin.y() + parent.height() - self.toast_margin
         
-        for toast in reversed(self.active_toasts):
+        for toast in reversed(self.active_toasts.values()):
             # Update toast width
-            toast_width = min(400, parent_rect.width() - 2 * self.toast_margin)
-            toast.setFixedWidth(toast_width)
+            if toast.width() != toast_width:
+                toast.setFixedWidth(toast_width)
             
-            # Calculate toast height
-            toast_height = toast.sizeHint().height()
+            # Calculate toast height (cached per toast until its content or width changes)
+            toast_height = toast.height_for_width(toast_width)
             
             # Position toast
-            x = parent_rect.width() - toast_width - self.toast_margin
             y -= toast_height + self.toast_spacing
             
             # Set position
             toast.setGeometry(x, y, toast_width, toast_height)
     
+    def eventFilter(self, watched, event):
+        """Reposition toasts when the parent is shown again, restored, moved or resized"""
+        if watched is self.parent() and event.type() in _REPOSITION_EVENTS:
+            self.position_toasts()
+        return super().eventFilter(watched, event)
+    
+    @Slot()
+    def _on_toast_fade_out_finished(self):
+        """Remove the toast whose fade out animation finished"""
+        self.remove_toast(self.sender().targetObject())
+    
     def remove_toast(self, toast):
         """Remove a toast notification"""
-        if toast in self.active_toasts:
-            self.active_toasts.remove(toast)
-            toast.deleteLater()
+        if self.active_toasts.pop(id(toast), None) is not None:
+            if len(self._pool) < MAX_POOLED_TOASTS:
+                self._pool.append(toast)
+            else:
+                toast.deleteLater()
+            
+            # Queued toasts take the freed slots
+            free = self.max_active - len(self.active_toasts)
+            if self._pending and free > 0:
+                self._show_pending(free)
             
             # Reposition remaining toasts
             self.position_toasts()
@@ -282,5 +491,5 @@ class ToastManager(QWidget):
         self.theme = theme
         
         # Update all active toasts
-        for toast in self.active_toasts:
+        for toast in self.active_toasts.values():
             toast.set_theme(theme)
@@ -1,110 +1,313 @@
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
-    QScrollArea, QGridLayout, QSplitter, QTextEdit, QWidget
+    QScrollArea, QGridLayout, QSplitter, QWidget, QListView
 )
-from PySide6.QtCore import Qt, Signal, QSize, QRect, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QPixmap, QIcon, QColor, QPainter, QFont, QCursor
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QObject, QRunnable, QThreadPool, QSize, QTimer,
+    QAbstractListModel, QModelIndex
+)
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage
 
 import os
 import sys
-from pathlib import Path
-import subprocess
-import shutil
-from typing import Dict, List, Optional
+from html import escape
+from typing import Dict, List, Optional, Tuple
 
-from src.utils.formatting import format_size, truncate_text
+from src.utils.formatting import format_size
+from src.utils.image_cache import fit_pixmap, load_cached_pixmap, thumbnail_cache_key, decode_scaled_image
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Delay before the smooth re-scale that follows the last resize event
+RESCALE_DELAY = 120
+
+# Size change in pixels below which live resizes keep the current pixmap
+RESCALE_THRESHOLD = 4
+
+# Bounding box gallery thumbnails are decoded at and drawn in
+THUMBNAIL_SIZE = QSize(200, 200)
+
+# Gallery cell size; the thumbnail plus room for its border
+GALLERY_GRID_SIZE = QSize(210, 210)
 
-class ImageThumbnail(QLabel):
-    """Clickable image thumbnail widget"""
+# Dialog stylesheets keyed by theme identity
+_SS_CACHE: Dict[int, str] = {}
+
+
+def _build_stylesheet(theme: Dict) -> str:
+    """Build the stylesheet applied once to the dialog and inherited by its children"""
+    return f"""
+        ModelDetailDialog {{
+            background-color: {theme['primary']};
+        }}
+        QListView#detailImageList {{
+            background-color: {theme['primary']};
+            color: {theme['text_secondary']};
+            border: none;
+        }}
+        QListView#detailImageList::item {{
+            background-color: {theme['secondary']};
+            border-radius: 4px;
+            border: 1px solid {theme['border']};
+        }}
+        QListView#detailImageList::item:hover {{
+            border: 2px solid {theme['accent']};
+        }}
+        QListView#detailImageList QScrollBar:vertical {{
+            background: {theme['primary']};
+            width: 14px;
+            margin: 0px;
+        }}
+        QListView#detailImageList QScrollBar::handle:vertical {{
+            background: {theme['secondary']};
+            min-height: 20px;
+            border-radius: 7px;
+            margin: 2px;
+        }}
+        QListView#detailImageList QScrollBar::add-line:vertical,
+        QListView#detailImageList QScrollBar::sub-line:vertical {{
+            height: 0px;
+        }}
+        QListView#detailImageList QScrollBar::up-arrow:vertical,
+        QListView#detailImageList QScrollBar::down-arrow:vertical {{
+            height: 0px;
+        }}
+        QListView#detailImageList QScrollBar::add-page:vertical,
+        QListView#detailImageList QScrollBar::sub-page:vertical {{
+            background: none;
+        }}
+        QFrame#detailCard {{
+            background-color: {theme['card']};
+            border-radius: 8px;
+            border: 1px solid {theme['border']};
+            padding: 10px;
+        }}
+        QLabel#detailSectionTitle {{
+            font-size: 16px;
+            font-weight: bold;
+            color: {theme['text']};
+            margin-bottom: 10px;
+        }}
+        QLabel#detailModelName {{
+            font-size: 18px;
+            font-weight: bold;
+            color: {theme['text']};
+        }}
+        QLabel#detailSecondaryText {{
+            color: {theme['text_secondary']};
+        }}
+        QLabel#detailValueText {{
+            color: {theme['text']};
+        }}
+        QLabel#detailEmptyText {{
+            color: {theme['text_secondary']};
+            font-style: italic;
+        }}
+        QScrollArea#detailTextBox {{
+            background-color: {theme['input_bg']};
+            border: 1px solid {theme['border']};
+            border-radius: 4px;
+        }}
+        QLabel#detailTextContent {{
+            background-color: {theme['input_bg']};
+            color: {theme['text']};
+            padding: 4px;
+        }}
+        QPushButton#detailSecondaryButton {{
+            background-color: {theme['secondary']};
+            color: {theme['text']};
+            border: 1px solid {theme['border']};
+            border-radius: 4px;
+            padding: 8px 16px;
+        }}
+        QPushButton#detailSecondaryButton:hover {{
+            background-color: {theme['card_hover']};
+            border-color: {theme['accent']};
+        }}
+        QPushButton#detailCloseButton {{
+            background-color: {theme['accent']};
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 8px 30px;
+            font-weight: bold;
+        }}
+        QPushButton#detailCloseButton:hover {{
+            background-color: {theme['accent_hover']};
+        }}
+        QFrame#imageViewerPanel {{
+            background-color: {theme['card']};
+            border-radius: 8px;
+            border: 1px solid {theme['border']};
+        }}
+        QLabel#imageViewerTitle {{
+            font-size: 16px;
+            font-weight: bold;
+            color: {theme['text']};
+        }}
+        QPushButton#imageViewerCloseButton {{
+            background-color: transparent;
+            color: {theme['text_secondary']};
+            border: none;
+            font-size: 18px;
+            font-weight: bold;
+        }}
+        QPushButton#imageViewerCloseButton:hover {{
+            color: {theme['danger']};
+        }}
+        QLabel#imageViewerPreview {{
+            background-color: {theme['secondary']};
+            color: {theme['text_secondary']};
+        }}
+        QFrame#imageViewerSection {{
+            background-color: {theme['secondary']};
+            border-radius: 4px;
+        }}
+        QLabel#imageViewerHeading {{
+            color: {theme['text']};
+            font-weight: bold;
+            font-size: 14px;
+        }}
+        QLabel#imageViewerStat {{
+            color: {theme['text']};
+            font-size: 14px;
+        }}
+    """
+
+
+def _stylesheet(theme: Dict) -> str:
+    """Get the dialog stylesheet for a theme, building it only once"""
+    sheet = _SS_CACHE.get(id(theme))
+    if sheet is None:
+        sheet = _SS_CACHE[id(theme)] = _build_stylesheet(theme)
+    return sheet
+
+
+def _build_info_items(model_data: Dict) -> List[Tuple[str, str]]:
+    """Get the (label, value) rows of the model information grid"""
+    get = model_data.get
+    return [
+        ("Type:", get("type", "Unknown")),
+        ("Base Model:", get("base_model", "Unknown")),
+        ("Version:", get("version_name", "Unknown")),
+        ("Size:", format_size(get("size", 0))),
+        ("Downloaded:", get("download_date", "Unknown")),
+        ("Last Updated:", get("last_updated", "Unknown")),
+        ("Path:", get("path", "Unknown"))
+    ]
+
+
+def create_text_box(text: str = "") -> Tuple[QScrollArea, QLabel]:
+    """Create a scrollable read-only text box, lighter than a read-only QTextEdit"""
+    label = QLabel(text)
+    label.setObjectName("detailTextContent")
+    label.setTextFormat(Qt.PlainText)
+    label.setWordWrap(True)
+    label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+    label.setTextInteractionFlags(Qt.TextSelectableByMouse)
     
-    clicked = Signal(dict)  # image data
+    box = QScrollArea()
+    box.setObjectName("detailTextBox")
+    box.setWidgetResizable(True)
+    box.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    box.setWidget(label)
+    return box, label
+
+
+def needs_rescale(last: QSize, target: QSize) -> bool:
+    """Check whether target differs enough from the last scaled size to re-scale"""
+    return (
+        abs(target.width() - last.width()) > RESCALE_THRESHOLD
+        or abs(target.height() - last.height()) > RESCALE_THRESHOLD
+    )
+
+
+def existing_image_path(image_data: Dict) -> Optional[str]:
+    """Get the local path of an image if the file exists"""
+    path = image_data.get("local_path")
+    return path if path and os.path.exists(path) else None
+
+
+class DecodeSignals(QObject):
+    """Signals emitted by DecodeTask"""
     
-    def __init__(self, image_data: Dict, theme: Dict, parent=None):
-        super().__init__(parent)
-        self.image_data = image_data
-        self.theme = theme
-        
-        # Set up widget
-        self.setCursor(Qt.PointingHandCursor)
-        self.setAlignment(Qt.AlignCenter)
-        self.setMinimumSize(120, 120)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {self.theme['secondary']};
-                border-radius: 4px;
-                border: 1px solid {self.theme['border']};
-            }}
-            QLabel:hover {{
-                border: 2px solid {self.theme['accent']};
-            }}
-        """)
-        
-        # Load image
-        self.load_image()
+    finished = Signal(str, QImage)  # path, decoded image
+
+
+class DecodeTask(QRunnable):
+    """Decodes a scaled image on a QThreadPool worker"""
     
-    def load_image(self):
-        """Load image from data"""
-        # Get path to image
-        if "local_path" in self.image_data and os.path.exists(self.image_data["local_path"]):
-            image_path = self.image_data["local_path"]
-            
-            # Load pixmap
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
-                # Scale pixmap to fit widget while maintaining aspect ratio
-                self.setPixmap(pixmap.scaled(
-                    self.size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                ))
-                return
+    def __init__(self, path: str, bound: QSize):
+        super().__init__()
+        self.path = path
+        self.bound = QSize(bound)
         
-        # If we get here, image loading failed
-        self.setText("No Image")
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {self.theme['secondary']};
-                color: {self.theme['text_secondary']};
-                border-radius: 4px;
-                border: 1px solid {self.theme['border']};
-            }}
-        """)
+        # Created on the GUI thread, so connected slots run there via queued calls
+        self.signals = DecodeSignals()
     
-    def mousePressEvent(self, event):
-        """Handle mouse press events"""
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit(self.image_data)
-        super().mousePressEvent(event)
+    def run(self):
+        """Decode the image and hand it back to the GUI thread"""
+        self.signals.finished.emit(self.path, decode_scaled_image(self.path, self.bound))
+
+
+class ImagesModel(QAbstractListModel):
+    """List model over a model's images that decodes thumbnails on demand"""
     
-    def resizeEvent(self, event):
-        """Handle resize events"""
-        # Reload image at new size
-        if hasattr(self, 'image_data'):
-            self.load_image()
-        super().resizeEvent(event)
+    def __init__(self, images: List[Dict], parent=None):
+        super().__init__(parent)
+        # Kept by reference; clicked rows hand these same dicts to the viewer panel
+        self.images = images
+        self._paths = [existing_image_path(image) for image in images]
+        self._decoding = set()
+        self._failed = set()
     
-    def set_theme(self, theme):
-        """Update theme"""
-        self.theme = theme
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {self.theme['secondary']};
-                border-radius: 4px;
-                border: 1px solid {self.theme['border']};
-            }}
-            QLabel:hover {{
-                border: 2px solid {self.theme['accent']};
-            }}
-        """)
-        
-        # Reload image
-        self.load_image()
+    def rowCount(self, parent=QModelIndex()):
+        """Get the number of images"""
+        return 0 if parent.isValid() else len(self.images)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Get the thumbnail or placeholder text for an image"""
+        if not index.isValid():
+            return None
+        
+        path = self._paths[index.row()]
+        if role == Qt.DecorationRole and path and path not in self._failed:
+            # Only visible rows are asked for, so only they get decoded
+            pixmap = QPixmapCache.find(thumbnail_cache_key(path, THUMBNAIL_SIZE))
+            if pixmap is not None and not pixmap.isNull():
+                return pixmap
+            self.request_decode(path)
+            return None
+        if role == Qt.DisplayRole and (not path or path in self._failed):
+            return "No Image"
+        return None
+    
+    def request_decode(self, path: str):
+        """Decode a thumbnail on a worker unless one is already running"""
+        if path in self._decoding:
+            return
+        self._decoding.add(path)
+        task = DecodeTask(path, THUMBNAIL_SIZE)
+        task.signals.finished.connect(self.on_image_decoded)
+        QThreadPool.globalInstance().start(task)
+    
+    @Slot(str, QImage)
+    def on_image_decoded(self, path: str, image: QImage):
+        """Cache a thumbnail decoded by a worker and repaint its rows"""
+        # Qt drops the queued call if the model was destroyed meanwhile
+        self._decoding.discard(path)
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull():
+            self._failed.add(path)
+        else:
+            QPixmapCache.insert(thumbnail_cache_key(path, THUMBNAIL_SIZE), pixmap)
+        
+        for row, row_path in enumerate(self._paths):
+            if row_path == path:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
 
 
 class ImageViewerPanel(QFrame):
@@ -112,20 +315,25 @@ class ImageViewerPanel(QFrame):
     
     closed = Signal()
     
+    # Reaction emoji and the image stats key holding their count
+    _REACTIONS = (("👍", "likeCount"), ("❤️", "heartCount"), ("😂", "laughCount"))
+    
     def __init__(self, image_data: Dict, theme: Dict, parent=None):
         super().__init__(parent)
         self.image_data = image_data
         self.theme = theme
+        self._orig_pixmap = None
+        self._last_scaled_size = QSize()
+        
+        # Resize events restart this timer so a drag ends with one smooth re-scale
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(RESCALE_DELAY)
+        self._rescale_timer.timeout.connect(self.load_image)
         
-        # Set up frame
+        # Set up frame, styled by the dialog stylesheet
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self.theme['card']};
-                border-radius: 8px;
-                border: 1px solid {self.theme['border']};
-            }}
-        """)
+        self.setObjectName("imageViewerPanel")
         
         self.init_ui()
     
@@ -141,27 +349,12 @@ class ImageViewerPanel(QFrame):
         
         # Title
         title = QLabel("Image Details")
-        title.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: bold;
-            color: {self.theme['text']};
-        """)
+        title.setObjectName("imageViewerTitle")
         
         # Close button
         close_btn = QPushButton("×")
         close_btn.setFixedSize(24, 24)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {self.theme['text_secondary']};
-                border: none;
-                font-size: 18px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                color: {self.theme['danger']};
-            }}
-        """)
+        close_btn.setObjectName("imageViewerCloseButton")
         close_btn.clicked.connect(self.closed.emit)
         
         header_layout.addWidget(title)
@@ -172,40 +365,24 @@ class ImageViewerPanel(QFrame):
         self.image_preview = QLabel()
         self.image_preview.setAlignment(Qt.AlignCenter)
         self.image_preview.setMinimumHeight(200)
-        self.image_preview.setStyleSheet(f"background-color: {self.theme['secondary']};")
-        self.load_image()
+        self.image_preview.setObjectName("imageViewerPreview")
         
         # Prompt section
         prompt_section = QFrame()
         prompt_section.setFrameShape(QFrame.StyledPanel)
-        prompt_section.setStyleSheet(f"background-color: {self.theme['secondary']}; border-radius: 4px;")
+        prompt_section.setObjectName("imageViewerSection")
         prompt_layout = QVBoxLayout(prompt_section)
         
         # Prompt label
         prompt_label = QLabel("Prompt")
-        prompt_label.setStyleSheet(f"color: {self.theme['text']}; font-weight: bold; font-size: 14px;")
+        prompt_label.setObjectName("imageViewerHeading")
         
-        # Get prompt text from image data
-        prompt_text = ""
-        if "meta" in self.image_data and self.image_data["meta"]:
-            prompt_text = self.image_data["meta"].get("prompt", "")
-        
-        # Prompt text edit
-        self.prompt_edit = QTextEdit()
-        self.prompt_edit.setPlainText(prompt_text)
-        self.prompt_edit.setReadOnly(True)
-        self.prompt_edit.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {self.theme['input_bg']};
-                color: {self.theme['text']};
-                border: 1px solid {self.theme['border']};
-                border-radius: 4px;
-            }}
-        """)
+        # Prompt text
+        prompt_box, self.prompt_text = create_text_box()
         
         # Add widgets to layout
         prompt_layout.addWidget(prompt_label)
-        prompt_layout.addWidget(self.prompt_edit)
+        prompt_layout.addWidget(prompt_box)
         
         # Stats section
         stats_section = self.create_stats_section()
@@ -215,127 +392,82 @@ class ImageViewerPanel(QFrame):
         layout.addWidget(self.image_preview, 1)  # Give image preview more space
         layout.addWidget(prompt_section)
         layout.addWidget(stats_section)
+        
+        # Fill in the widgets for the initial image
+        self.set_image_data(self.image_data)
     
     def create_stats_section(self):
         """Create section with image stats"""
         section = QFrame()
         section.setFrameShape(QFrame.StyledPanel)
-        section.setStyleSheet(f"background-color: {self.theme['secondary']}; border-radius: 4px;")
+        section.setObjectName("imageViewerSection")
         layout = QHBoxLayout(section)
         
-        # Get stats from image data
-        stats = self.image_data.get("stats", {})
-        reactions = [
-            ("👍", stats.get("likeCount", 0)),
-            ("❤️", stats.get("heartCount", 0)),
-            ("😂", stats.get("laughCount", 0))
-        ]
-        
-        # Add reaction stats
-        for emoji, count in reactions:
-            stat_label = QLabel(f"{emoji} {count}")
-            stat_label.setStyleSheet(f"color: {self.theme['text']}; font-size: 14px;")
+        # Reaction stats, filled in by set_image_data
+        self._stat_labels: List[QLabel] = []
+        for _ in self._REACTIONS:
+            stat_label = QLabel()
+            stat_label.setObjectName("imageViewerStat")
             layout.addWidget(stat_label)
+            self._stat_labels.append(stat_label)
         
         layout.addStretch()
         
         return section
     
-    def load_image(self):
+    def set_image_data(self, image_data: Dict):
+        """Show another image, updating the existing widgets in place"""
+        self.image_data = image_data
+        self._orig_pixmap = None
+        
+        # Checked once per image; resizes don't stat the file again
+        self._image_path = existing_image_path(image_data)
+        
+        # Prompt from image metadata
+        prompt_text = ""
+        if "meta" in self.image_data and self.image_data["meta"]:
+            prompt_text = self.image_data["meta"].get("prompt", "")
+        self.prompt_text.setText(prompt_text)
+        
+        # Reaction counts
+        stats = self.image_data.get("stats", {})
+        for label, (emoji, key) in zip(self._stat_labels, self._REACTIONS):
+            label.setText(f"{emoji} {stats.get(key, 0)}")
+        
+        self.load_image()
+    
+    @Slot()
+    def load_image(self, transform=Qt.SmoothTransformation):
         """Load image from data"""
         # Get path to image
-        if "local_path" in self.image_data and os.path.exists(self.image_data["local_path"]):
-            image_path = self.image_data["local_path"]
+        if self._image_path:
+            # Full-size decode, shared by every viewer opened on this image
+            if self._orig_pixmap is None:
+                self._orig_pixmap = load_cached_pixmap(self._image_path)
             
-            # Load pixmap
-            pixmap = QPixmap(image_path)
+            pixmap = self._orig_pixmap
             if not pixmap.isNull():
                 # Scale pixmap to fit widget while maintaining aspect ratio
-                self.image_preview.setPixmap(pixmap.scaled(
-                    self.image_preview.width(), 
-                    self.image_preview.height(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                ))
+                self._last_scaled_size = self.image_preview.size()
+                self.image_preview.setPixmap(fit_pixmap(pixmap, self._last_scaled_size, transform))
                 return
         
         # If we get here, image loading failed
         self.image_preview.setText("Image not found")
-        self.image_preview.setStyleSheet(f"""
-            background-color: {self.theme['secondary']};
-            color: {self.theme['text_secondary']};
-        """)
     
     def resizeEvent(self, event):
         """Handle resize events"""
-        # Reload image at new size
-        if hasattr(self, 'image_data'):
-            self.load_image()
+        # Cheap re-scale while resizing, smooth re-scale once resizing settles
+        if hasattr(self, '_rescale_timer'):
+            if (self._orig_pixmap is not None and not self._orig_pixmap.isNull()
+                    and needs_rescale(self._last_scaled_size, self.image_preview.size())):
+                self.load_image(Qt.FastTransformation)
+            self._rescale_timer.start()
         super().resizeEvent(event)
     
     def set_theme(self, theme):
-        """Update theme"""
+        """Update theme; styling follows the dialog stylesheet"""
         self.theme = theme
-        
-        # Update frame style
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self.theme['card']};
-                border-radius: 8px;
-                border: 1px solid {self.theme['border']};
-            }}
-        """)
-        
-        # Update components
-        title = self.findChild(QLabel, "", Qt.FindChildrenRecursively)
-        if title and title.text() == "Image Details":
-            title.setStyleSheet(f"""
-                font-size: 16px;
-                font-weight: bold;
-                color: {self.theme['text']};
-            """)
-        
-        # Update close button
-        for button in self.findChildren(QPushButton):
-            if button.text() == "×":
-                button.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: transparent;
-                        color: {self.theme['text_secondary']};
-                        border: none;
-                        font-size: 18px;
-                        font-weight: bold;
-                    }}
-                    QPushButton:hover {{
-                        color: {self.theme['danger']};
-                    }}
-                """)
-        
-        # Update image preview
-        self.image_preview.setStyleSheet(f"background-color: {self.theme['secondary']};")
-        self.load_image()
-        
-        # Update prompt section
-        for frame in self.findChildren(QFrame):
-            frame.setStyleSheet(f"background-color: {self.theme['secondary']}; border-radius: 4px;")
-        
-        # Update text edit
-        self.prompt_edit.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {self.theme['input_bg']};
-                color: {self.theme['text']};
-                border: 1px solid {self.theme['border']};
-                border-radius: 4px;
-            }}
-        """)
-        
-        # Update labels
-        for label in self.findChildren(QLabel):
-            if label != self.image_preview and label.text() != "Image Details":
-                if "font-weight: bold" in label.styleSheet():
-                    label.setStyleSheet(f"color: {self.theme['text']}; font-weight: bold; font-size: 14px;")
-                else:
-                    label.setStyleSheet(f"color: {self.theme['text']}; font-size: 14px;")
 
 
 class ModelDetailDialog(QDialog):
@@ -347,11 +479,14 @@ class ModelDetailDialog(QDialog):
         self.theme = theme
         self.parent_window = parent
         self.current_image_panel = None
+        self.images_model = None
         
         # Set up dialog
         self.setWindowTitle(f"Model Details: {model_data.get('name', 'Unknown')}")
         self.resize(900, 700)
-        self.setStyleSheet(f"background-color: {self.theme['primary']};")
+        
+        # One stylesheet for the dialog and every widget inside it
+        self.setStyleSheet(_stylesheet(self.theme))
         
         self.init_ui()
     
@@ -372,74 +507,33 @@ class ModelDetailDialog(QDialog):
         
         # Gallery title
         gallery_title = QLabel("Image Gallery")
-        gallery_title.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: bold;
-            color: {self.theme['text']};
-            margin-bottom: 10px;
-        """)
+        gallery_title.setObjectName("detailSectionTitle")
         left_layout.addWidget(gallery_title)
         
-        # Image grid
-        self.image_grid = QWidget()
-        grid_layout = QGridLayout(self.image_grid)
-        grid_layout.setContentsMargins(0, 0, 0, 0)
-        grid_layout.setSpacing(10)
-        
-        # Add images to grid
+        # Image gallery; the view only paints and decodes the visible thumbnails
         images = self.model_data.get("images", [])
         if images:
-            row, col = 0, 0
-            cols = 3  # 3x3 grid
+            self.images_model = ImagesModel(images, self)
             
-            for i, image in enumerate(images[:9]):  # Limit to 9 images
-                thumbnail = ImageThumbnail(image, self.theme)
-                thumbnail.clicked.connect(self.show_image_details)
-                grid_layout.addWidget(thumbnail, row, col)
-                
-                col += 1
-                if col >= cols:
-                    col = 0
-                    row += 1
+            gallery = QListView()
+            gallery.setObjectName("detailImageList")
+            gallery.setViewMode(QListView.IconMode)
+            gallery.setResizeMode(QListView.Adjust)
+            gallery.setMovement(QListView.Static)
+            gallery.setGridSize(GALLERY_GRID_SIZE)
+            gallery.setIconSize(THUMBNAIL_SIZE)
+            gallery.setUniformItemSizes(True)
+            gallery.setSelectionMode(QListView.NoSelection)
+            gallery.setCursor(Qt.PointingHandCursor)
+            gallery.setModel(self.images_model)
+            gallery.clicked.connect(self.on_image_clicked)
+            left_layout.addWidget(gallery)
         else:
             # No images message
             no_images = QLabel("No images available")
             no_images.setAlignment(Qt.AlignCenter)
-            no_images.setStyleSheet(f"color: {self.theme['text_secondary']}; font-style: italic;")
-            grid_layout.addWidget(no_images, 0, 0, 1, 3)
-        
-        # Add image grid to scroll area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setWidget(self.image_grid)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {self.theme['primary']};
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background: {self.theme['primary']};
-                width: 14px;
-                margin: 0px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {self.theme['secondary']};
-                min-height: 20px;
-                border-radius: 7px;
-                margin: 2px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {{
-                height: 0px;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: none;
-            }}
-        """)
-        
-        left_layout.addWidget(scroll)
+            no_images.setObjectName("detailEmptyText")
+            left_layout.addWidget(no_images)
         
         # Right side - model info
         right_panel = QWidget()
@@ -450,26 +544,17 @@ class ModelDetailDialog(QDialog):
         # Model title section
         title_section = QFrame()
         title_section.setFrameShape(QFrame.StyledPanel)
-        title_section.setStyleSheet(f"""
-            background-color: {self.theme['card']};
-            border-radius: 8px;
-            border: 1px solid {self.theme['border']};
-            padding: 10px;
-        """)
+        title_section.setObjectName("detailCard")
         title_layout = QVBoxLayout(title_section)
         
         # Model name
         name_label = QLabel(self.model_data.get("name", "Unknown Model"))
         name_label.setWordWrap(True)
-        name_label.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: bold;
-            color: {self.theme['text']};
-        """)
+        name_label.setObjectName("detailModelName")
         
         # Model creator
         creator_label = QLabel(f"By: {self.model_data.get('creator', 'Unknown')}")
-        creator_label.setStyleSheet(f"color: {self.theme['text_secondary']};")
+        creator_label.setObjectName("detailSecondaryText")
         
         title_layout.addWidget(name_label)
         title_layout.addWidget(creator_label)
@@ -477,22 +562,12 @@ class ModelDetailDialog(QDialog):
         # Model info section
         info_section = QFrame()
         info_section.setFrameShape(QFrame.StyledPanel)
-        info_section.setStyleSheet(f"""
-            background-color: {self.theme['card']};
-            border-radius: 8px;
-            border: 1px solid {self.theme['border']};
-            padding: 10px;
-        """)
+        info_section.setObjectName("detailCard")
         info_layout = QVBoxLayout(info_section)
         
         # Info title
         info_title = QLabel("Model Information")
-        info_title.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: bold;
-            color: {self.theme['text']};
-            margin-bottom: 10px;
-        """)
+        info_title.setObjectName("detailSectionTitle")
         info_layout.addWidget(info_title)
         
         # Info grid
@@ -502,22 +577,12 @@ class ModelDetailDialog(QDialog):
         info_grid.setHorizontalSpacing(15)
         
         # Add info rows
-        info_items = [
-            ("Type:", self.model_data.get("type", "Unknown")),
-            ("Base Model:", self.model_data.get("base_model", "Unknown")),
-            ("Version:", self.model_data.get("version_name", "Unknown")),
-            ("Size:", format_size(self.model_data.get("size", 0))),
-            ("Downloaded:", self.model_data.get("download_date", "Unknown")),
-            ("Last Updated:", self.model_data.get("last_updated", "Unknown")),
-            ("Path:", self.model_data.get("path", "Unknown"))
-        ]
-        
-        for i, (label_text, value_text) in enumerate(info_items):
+        for i, (label_text, value_text) in enumerate(_build_info_items(self.model_data)):
             label = QLabel(label_text)
-            label.setStyleSheet(f"color: {self.theme['text_secondary']};")
+            label.setObjectName("detailSecondaryText")
             
             value = QLabel(value_text)
-            value.setStyleSheet(f"color: {self.theme['text']};")
+            value.setObjectName("detailValueText")
             value.setWordWrap(True)
             
             info_grid.addWidget(label, i, 0)
@@ -530,23 +595,11 @@ class ModelDetailDialog(QDialog):
         path_layout.setContentsMargins(0, 10, 0, 0)
         
         open_folder_btn = QPushButton("Open Folder")
-        open_folder_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['secondary']};
-                color: {self.theme['text']};
-                border: 1px solid {self.theme['border']};
-                border-radius: 4px;
-                padding: 8px 16px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['card_hover']};
-                border-color: {self.theme['accent']};
-            }}
-        """)
+        open_folder_btn.setObjectName("detailSecondaryButton")
         open_folder_btn.clicked.connect(self.open_model_folder)
         
         copy_path_btn = QPushButton("Copy Path")
-        copy_path_btn.setStyleSheet(open_folder_btn.styleSheet())
+        copy_path_btn.setObjectName("detailSecondaryButton")
         copy_path_btn.clicked.connect(self.copy_model_path)
         
         path_layout.addWidget(open_folder_btn)
@@ -558,82 +611,41 @@ class ModelDetailDialog(QDialog):
         # Description section
         desc_section = QFrame()
         desc_section.setFrameShape(QFrame.StyledPanel)
-        desc_section.setStyleSheet(info_section.styleSheet())
+        desc_section.setObjectName("detailCard")
         desc_layout = QVBoxLayout(desc_section)
         
         # Description title
         desc_title = QLabel("Description")
-        desc_title.setStyleSheet(info_title.styleSheet())
+        desc_title.setObjectName("detailSectionTitle")
         desc_layout.addWidget(desc_title)
         
         # Description text
-        desc_text = QTextEdit()
-        desc_text.setReadOnly(True)
-        desc_text.setPlainText(self.model_data.get("description", "No description available."))
-        desc_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {self.theme['input_bg']};
-                color: {self.theme['text']};
-                border: 1px solid {self.theme['border']};
-                border-radius: 4px;
-            }}
-        """)
-        desc_layout.addWidget(desc_text)
+        desc_box, _ = create_text_box(self.model_data.get("description", "No description available."))
+        desc_layout.addWidget(desc_box)
         
         # Tags section
         tags_section = QFrame()
         tags_section.setFrameShape(QFrame.StyledPanel)
-        tags_section.setStyleSheet(info_section.styleSheet())
+        tags_section.setObjectName("detailCard")
         tags_layout = QVBoxLayout(tags_section)
         
         # Tags title
         tags_title = QLabel("Tags")
-        tags_title.setStyleSheet(info_title.styleSheet())
+        tags_title.setObjectName("detailSectionTitle")
         tags_layout.addWidget(tags_title)
         
-        # Tags flow layout
-        tags_flow = QHBoxLayout()
-        tags_flow.setSpacing(5)
-        
-        # Add tags
+        # Tags, rendered as chips inside a single rich-text label
         tags = self.model_data.get("tags", [])
-        tag_count = 0
-        
-        for tag in tags:
-            # Create tag chip
-            tag_chip = QFrame()
-            tag_chip.setStyleSheet(f"""
-                background-color: {self.theme['secondary']};
-                border-radius: 4px;
-                padding: 3px;
-            """)
-            tag_layout = QHBoxLayout(tag_chip)
-            tag_layout.setContentsMargins(8, 3, 8, 3)
-            tag_layout.setSpacing(0)
-            
-            tag_label = QLabel(tag)
-            tag_label.setStyleSheet(f"color: {self.theme['text_secondary']};")
-            tag_layout.addWidget(tag_label)
-            
-            tags_flow.addWidget(tag_chip)
-            tag_count += 1
-            
-            # Wrap to next line if too many tags
-            if tag_count % 3 == 0:
-                tags_flow.addStretch()
-                tags_layout.addLayout(tags_flow)
-                tags_flow = QHBoxLayout()
-                tags_flow.setSpacing(5)
-        
-        # Add remaining tags
-        if tags_flow.count() > 0:
-            tags_flow.addStretch()
-            tags_layout.addLayout(tags_flow)
-        
-        if not tags:
+        self.tags_label = None
+        if tags:
+            self.tags_label = QLabel(self.tags_html())
+            self.tags_label.setTextFormat(Qt.RichText)
+            self.tags_label.setWordWrap(True)
+            tags_layout.addWidget(self.tags_label)
+        else:
             # No tags message
             no_tags = QLabel("No tags available")
-            no_tags.setStyleSheet(f"color: {self.theme['text_secondary']}; font-style: italic;")
+            no_tags.setObjectName("detailEmptyText")
             tags_layout.addWidget(no_tags)
         
         # Add sections to right panel
@@ -655,35 +667,52 @@ class ModelDetailDialog(QDialog):
         # Add close button at bottom
         button_layout = QHBoxLayout()
         close_btn = QPushButton("Close")
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['accent']};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 30px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['accent_hover']};
-            }}
-        """)
+        close_btn.setObjectName("detailCloseButton")
         close_btn.clicked.connect(self.accept)
         
         button_layout.addStretch()
         button_layout.addWidget(close_btn)
         layout.addLayout(button_layout)
     
+    def set_theme(self, theme):
+        """Update theme"""
+        self.theme = theme
+        self.setStyleSheet(_stylesheet(theme))
+        
+        # Tag chips carry their colors inline
+        if self.tags_label:
+            self.tags_label.setText(self.tags_html())
+        
+        # Children only keep the theme; their styling comes from the sheet above
+        if self.current_image_panel:
+            self.current_image_panel.set_theme(theme)
+    
+    def tags_html(self) -> str:
+        """Get the model tags as rich-text chips"""
+        chip = (
+            f'<span style="background-color: {self.theme["secondary"]}; '
+            f'color: {self.theme["text_secondary"]};">&nbsp;&nbsp;{{}}&nbsp;&nbsp;</span>'
+        )
+        return " ".join(chip.format(escape(tag)) for tag in self.model_data.get("tags", []))
+    
+    @Slot(QModelIndex)
+    def on_image_clicked(self, index: QModelIndex):
+        """Show the details of the clicked gallery image"""
+        self.show_image_details(self.images_model.images[index.row()])
+    
+    @Slot(dict)
     def show_image_details(self, image_data):
         """Show image details panel"""
-        # Remove existing panel if any
-        if self.current_image_panel:
-            self.current_image_panel.deleteLater()
-            self.current_image_panel = None
-        
-        # Create new panel
-        self.current_image_panel = ImageViewerPanel(image_data, self.theme, self)
-        self.current_image_panel.closed.connect(self.close_image_details)
+        # The panel is built on first use and then reused for every image
+        if self.current_image_panel is None:
+            self.current_image_panel = ImageViewerPanel(image_data, self.theme, self)
+            self.current_image_panel.closed.connect(self.close_image_details)
+        elif self.current_image_panel.image_data is not image_data:
+            self.current_image_panel.set_image_data(image_data)
+        elif self.current_image_panel.isVisible():
+            # Same image re-clicked while shown; nothing to update
+            self.current_image_panel.raise_()
+            return
         
         # Position panel
         self.current_image_panel.setGeometry(
@@ -695,13 +724,16 @@ class ModelDetailDialog(QDialog):
         
         # Show with animation
         self.current_image_panel.show()
+        self.current_image_panel.raise_()
     
+    @Slot()
     def close_image_details(self):
         """Close image details panel"""
+        # Hidden rather than deleted so the next image reuses it
         if self.current_image_panel:
-            self.current_image_panel.deleteLater()
-            self.current_image_panel = None
+            self.current_image_panel.hide()
     
+    @Slot()
     def open_model_folder(self):
         """Open model folder in file explorer"""
         path = self.model_data.get("path", "")
@@ -710,6 +742,7 @@ class ModelDetailDialog(QDialog):
         
         # Open folder based on platform
         try:
+            import subprocess
             if sys.platform == "win32":
                 os.startfile(path)
             elif sys.platform == "darwin":  # macOS
@@ -719,6 +752,7 @@ class ModelDetailDialog(QDialog):
         except Exception as e:
             logger.error(f"Error opening folder: {str(e)}")
     
+    @Slot()
     def copy_model_path(self):
         """Copy model path to clipboard"""
         path = self.model_data.get("path", "")
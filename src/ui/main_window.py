@@ -13,6 +13,7 @@ import sys
 from pathlib import Path
 import time
 
+from src.constants.constants import DOWNLOAD_STATUS
 from src.constants.theme import get_theme
 from src.core.download_manager import DownloadManager, DownloadQueue
 from src.core.storage_manager import StorageManager
@@ -125,11 +126,10 @@ class MainWindow(QMainWindow):
         self.process_timer.timeout.connect(self.process_download_queue)
         self.process_timer.start()
         
-        # Bandwidth monitor update timer
+        # Bandwidth monitor update timer (started when a download begins)
         self.bandwidth_timer = QTimer(self)
         self.bandwidth_timer.setInterval(1000)  # Update every second
         self.bandwidth_timer.timeout.connect(self.update_bandwidth_graph)
-        self.bandwidth_timer.start()
         
         # Scan for new models
         self.scan_for_models()
@@ -181,6 +181,10 @@ class MainWindow(QMainWindow):
         # Update download tab
         self.download_tab.update_download_task(task)
         
+        # Resume bandwidth updates while something is downloading
+        if task.status == DOWNLOAD_STATUS["DOWNLOADING"] and not self.bandwidth_timer.isActive():
+            self.bandwidth_timer.start()
+        
         # If task was completed, add to database
         if task.status == "completed" and task.model_info:
             model_info = task.model_info
@@ -334,6 +338,10 @@ class MainWindow(QMainWindow):
         
         # Update graph in download tab
         self.download_tab.update_bandwidth_graph(times, values)
+        
+        # Stop polling once the queue is idle; the next download restarts it
+        if self.download_queue.current_url is None:
+            self.bandwidth_timer.stop()
     
     def show_model_details(self, model_data):
         """Show model details dialog"""
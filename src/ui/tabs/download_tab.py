@@ -4,7 +4,7 @@ from PySide6.QtWidgets import (
     QPushButton, QTextEdit, QLineEdit, QSpinBox, QFrame,
     QProgressBar
 )
-from PySide6.QtCore import Qt, Signal, QRegularExpression, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QRegularExpression, QTimer
 from PySide6.QtGui import QRegularExpressionValidator
 
 from src.ui.components.log_widget import LogWidget
@@ -79,6 +79,8 @@ class DownloadTab(QWidget):
         self.queue_widget.cancel_requested.connect(self.cancel_download)
         self.queue_widget.clear_requested.connect(self.clear_queue)
         self.queue_widget.move_requested.connect(self.move_in_queue)
+        self.queue_widget.move_to_top_requested.connect(self.move_to_top)
+        self.queue_widget.move_to_bottom_requested.connect(self.move_to_bottom)
         
         right_layout.addWidget(self.queue_widget)
         
@@ -312,18 +314,31 @@ class DownloadTab(QWidget):
         all_tasks = self.parent_window.download_queue.get_all_tasks()
         self.queue_widget.update_tasks(all_tasks)
     
+    @Slot(str)
     def cancel_download(self, url):
         """Signal to cancel a download"""
         self.parent_window.cancel_download(url)
     
+    @Slot()
     def clear_queue(self):
         """Signal to clear the download queue"""
         self.parent_window.clear_download_queue()
     
+    @Slot(str, int)
     def move_in_queue(self, url, new_position):
         """Signal to move a download in the queue"""
         self.parent_window.move_download_in_queue(url, new_position)
     
+    @Slot(str)
+    def move_to_top(self, url):
+        """Signal to move a download to the front of the queue"""
+        self.parent_window.move_download_in_queue(url, 0)
+    
+    @Slot(str)
+    def move_to_bottom(self, url):
+        """Signal to move a download to the end of the queue"""
+        self.parent_window.move_download_in_queue(url, self.parent_window.download_queue.size())
+    
     def update_bandwidth_graph(self, times, values):
         """Update bandwidth graph with new data"""
         self.queue_widget.update_bandwidth_graph(times, values)
@@ -2,9 +2,9 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
     QScrollArea, QGridLayout, QFileDialog, QMessageBox, QProgressBar,
-    QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView
+    QTabWidget, QTableView, QHeaderView
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QPixmap, QIcon, QColor
 
 import pyqtgraph as pg
@@ -14,10 +14,160 @@ from typing import Dict, List, Optional
 
 from src.core.storage_manager import StorageManager
 from src.ui.components.storage_info_widget import StorageInfoWidget
+from src.utils.formatting import format_size
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Tab stylesheets keyed by theme identity
+_SS_CACHE: Dict[int, str] = {}
+
+
+def _stylesheet(theme: Dict) -> str:
+    """Get the storage tab stylesheet for a theme, formatting it only once"""
+    sheet = _SS_CACHE.get(id(theme))
+    if sheet is None:
+        sheet = _SS_CACHE[id(theme)] = f"""
+            QTabWidget#storageTabs::pane {{
+                border: 1px solid {theme['border']};
+                background: {theme['secondary']};
+            }}
+            QTabWidget#storageTabs > QTabBar::tab {{
+                background: {theme['secondary']};
+                color: {theme['text_secondary']};
+                padding: 8px 16px;
+                border: 1px solid {theme['border']};
+                margin-right: 2px;
+            }}
+            QTabWidget#storageTabs > QTabBar::tab:selected {{
+                background: {theme['primary']};
+                color: {theme['text']};
+                border-bottom-color: {theme['primary']};
+            }}
+            QTabWidget#storageTabs > QTabBar::tab:hover:!selected {{
+                background: {theme['card_hover']};
+            }}
+            QTableView#storageModelsTable {{
+                background-color: {theme['secondary']};
+                gridline-color: {theme['border']};
+                color: {theme['text']};
+                border: none;
+            }}
+            QTableView#storageModelsTable::item {{
+                padding: 4px;
+            }}
+            QTableView#storageModelsTable::item:selected {{
+                background-color: {theme['accent']};
+                color: white;
+            }}
+            QTableView#storageModelsTable QHeaderView::section {{
+                background-color: {theme['card']};
+                color: {theme['text']};
+                padding: 6px;
+                border: 1px solid {theme['border']};
+            }}
+            QFrame#storageToolbar {{
+                background-color: {theme['card']};
+                border-radius: 4px;
+            }}
+            QPushButton#storageDeleteButton, QPushButton#storageExportButton,
+            QPushButton#storageScanButton {{
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 4px;
+            }}
+            QPushButton#storageDeleteButton {{
+                background-color: {theme['danger']};
+            }}
+            QPushButton#storageDeleteButton:hover {{
+                background-color: {theme['danger_hover']};
+            }}
+            QPushButton#storageExportButton {{
+                background-color: {theme['accent']};
+            }}
+            QPushButton#storageScanButton {{
+                background-color: {theme['info']};
+            }}
+            QPushButton#storageExportButton:hover, QPushButton#storageScanButton:hover {{
+                background-color: {theme['accent_hover']};
+            }}
+            QPushButton#storageDuplicatesButton {{
+                background-color: {theme['secondary']};
+                color: {theme['text']};
+                border: 1px solid {theme['border']};
+                padding: 8px 16px;
+                border-radius: 4px;
+            }}
+            QPushButton#storageDuplicatesButton:hover {{
+                background-color: {theme['card_hover']};
+            }}
+            QPushButton#storageRowDeleteButton, QPushButton#storageRowViewButton {{
+                background-color: transparent;
+                color: {theme['text_secondary']};
+                border: none;
+            }}
+            QPushButton#storageRowDeleteButton:hover {{
+                color: {theme['danger']};
+            }}
+            QPushButton#storageRowViewButton:hover {{
+                color: {theme['accent']};
+            }}
+        """
+    return sheet
+
+class ModelsTableModel(QAbstractTableModel):
+    """Read-only table model over the model records listed in the storage tab"""
+    
+    HEADERS = ("Name", "Type", "Size", "Base Model", "Actions")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.models: List[Dict] = []
+    
+    def set_models(self, models: List[Dict]):
+        """Replace the listed models"""
+        self.beginResetModel()
+        self.models = models
+        self.endResetModel()
+    
+    def model_id(self, row: int):
+        """Get the id of the model shown in a row"""
+        return self.models[row].get("id")
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Get the number of rows"""
+        return 0 if parent.isValid() else len(self.models)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Get the number of columns"""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Get the data shown in a cell, read straight from the model record"""
+        if not index.isValid():
+            return None
+        
+        model = self.models[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return model.get("name", "Unknown")
+            if column == 1:
+                return model.get("type", "Unknown")
+            if column == 2:
+                return format_size(model.get("size", 0))
+            if column == 3:
+                return model.get("base_model", "Unknown")
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Get the column titles"""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class StorageTab(QWidget):
     """Tab for storage management"""
     
@@ -32,119 +182,50 @@ class StorageTab(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
+        # One stylesheet for the whole tab; children are matched by object name
+        self.setStyleSheet(_stylesheet(self.theme))
+        
         # Create storage overview section
         self.storage_info_widget = StorageInfoWidget(self.theme)
         
         # Create tabs for different storage views
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border: 1px solid {self.theme['border']};
-                background: {self.theme['secondary']};
-            }}
-            QTabBar::tab {{
-                background: {self.theme['secondary']};
-                color: {self.theme['text_secondary']};
-                padding: 8px 16px;
-                border: 1px solid {self.theme['border']};
-                margin-right: 2px;
-            }}
-            QTabBar::tab:selected {{
-                background: {self.theme['primary']};
-                color: {self.theme['text']};
-                border-bottom-color: {self.theme['primary']};
-            }}
-            QTabBar::tab:hover:!selected {{
-                background: {self.theme['card_hover']};
-            }}
-        """)
+        self.tabs.setObjectName("storageTabs")
         
         # Create models tab
         self.models_tab = QWidget()
         models_layout = QVBoxLayout(self.models_tab)
         
         # Add table for model list
-        self.models_table = QTableWidget(0, 5)  # Rows will be added dynamically, 5 columns
-        self.models_table.setHorizontalHeaderLabels(["Name", "Type", "Size", "Base Model", "Actions"])
+        self.models_model = ModelsTableModel(self)
+        self.models_table = QTableView()
+        self.models_table.setModel(self.models_model)
         self.models_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.models_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.models_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
         self.models_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
         self.models_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        self.models_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.models_table.setSelectionMode(QTableWidget.ExtendedSelection)
-        self.models_table.setStyleSheet(f"""
-            QTableWidget {{
-                background-color: {self.theme['secondary']};
-                gridline-color: {self.theme['border']};
-                color: {self.theme['text']};
-                border: none;
-            }}
-            QTableWidget::item {{
-                padding: 4px;
-            }}
-            QTableWidget::item:selected {{
-                background-color: {self.theme['accent']};
-                color: white;
-            }}
-            QHeaderView::section {{
-                background-color: {self.theme['card']};
-                color: {self.theme['text']};
-                padding: 6px;
-                border: 1px solid {self.theme['border']};
-            }}
-        """)
+        self.models_table.setSelectionBehavior(QTableView.SelectRows)
+        self.models_table.setSelectionMode(QTableView.ExtendedSelection)
+        self.models_table.setObjectName("storageModelsTable")
         
         # Add toolbar for batch operations
         toolbar = QFrame()
         toolbar.setFrameShape(QFrame.StyledPanel)
-        toolbar.setStyleSheet(f"background-color: {self.theme['card']}; border-radius: 4px;")
+        toolbar.setObjectName("storageToolbar")
         toolbar_layout = QHBoxLayout(toolbar)
         
         # Add toolbar buttons
         self.delete_btn = QPushButton("Delete Selected")
-        self.delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['danger']};
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['danger_hover']};
-            }}
-        """)
+        self.delete_btn.setObjectName("storageDeleteButton")
         self.delete_btn.clicked.connect(self.delete_selected_models)
         
         self.export_btn = QPushButton("Export Selected")
-        self.export_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['accent']};
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['accent_hover']};
-            }}
-        """)
+        self.export_btn.setObjectName("storageExportButton")
         self.export_btn.clicked.connect(self.export_selected_models)
         
         self.find_duplicates_btn = QPushButton("Find Duplicates")
-        self.find_duplicates_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['secondary']};
-                color: {self.theme['text']};
-                border: 1px solid {self.theme['border']};
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['card_hover']};
-            }}
-        """)
+        self.find_duplicates_btn.setObjectName("storageDuplicatesButton")
         self.find_duplicates_btn.clicked.connect(self.find_duplicates)
         
         # Add buttons to toolbar
@@ -155,18 +236,7 @@ class StorageTab(QWidget):
         
         # Add scan button
         self.scan_btn = QPushButton("Scan for Models")
-        self.scan_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['info']};
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['accent_hover']};
-            }}
-        """)
+        self.scan_btn.setObjectName("storageScanButton")
         self.scan_btn.clicked.connect(self.scan_for_models)
         toolbar_layout.addWidget(self.scan_btn)
         
@@ -174,22 +244,17 @@ class StorageTab(QWidget):
         models_layout.addWidget(toolbar)
         models_layout.addWidget(self.models_table)
         
-        # Create disk usage tab
+        # Create disk usage tab; its pie chart is built the first time the tab is shown
         self.disk_tab = QWidget()
-        disk_layout = QVBoxLayout(self.disk_tab)
-        
-        # Create pie chart
-        self.chart_widget = pg.PlotWidget()
-        self.chart_widget.setBackground(self.theme["secondary"])
-        self.chart_widget.setMinimumHeight(300)
-        
-        # Add to layout
-        disk_layout.addWidget(self.chart_widget)
-        disk_layout.addWidget(self.storage_info_widget)
+        self.disk_layout = QVBoxLayout(self.disk_tab)
+        self.disk_layout.addWidget(self.storage_info_widget)
+        self.chart_widget = None
+        self._pending_categories = None
         
         # Add tabs to tab widget
         self.tabs.addTab(self.models_tab, "Models")
         self.tabs.addTab(self.disk_tab, "Disk Usage")
+        self.tabs.currentChanged.connect(self.on_tab_changed)
         
         # Add components to main layout
         layout.addWidget(self.tabs)
@@ -212,8 +277,30 @@ class StorageTab(QWidget):
         # Update models table
         self.refresh_models_table()
     
+    @Slot(int)
+    def on_tab_changed(self, index):
+        """Build the disk usage chart when its tab is first shown"""
+        if self.chart_widget is not None or self.tabs.widget(index) is not self.disk_tab:
+            return
+        
+        # Create pie chart
+        self.chart_widget = pg.PlotWidget()
+        self.chart_widget.setBackground(self.theme["secondary"])
+        self.chart_widget.setMinimumHeight(300)
+        self.disk_layout.insertWidget(0, self.chart_widget)
+        
+        # Draw the data that arrived while the chart didn't exist
+        if self._pending_categories is not None:
+            categories, self._pending_categories = self._pending_categories, None
+            self.update_pie_chart(categories)
+    
     def update_pie_chart(self, categories):
         """Update pie chart with storage data"""
+        # Keep the data until the disk usage tab builds its chart
+        if self.chart_widget is None:
+            self._pending_categories = categories
+            return
+        
         self.chart_widget.clear()
         
         # Skip if no data
@@ -264,7 +351,6 @@ class StorageTab(QWidget):
             
             # Add to legend
             percent = size / total * 100
-            from src.utils.formatting import format_size
             legend.addItem(
                 sector, 
                 f"{label}: {format_size(size)} ({percent:.1f}%)"
@@ -280,78 +366,40 @@ class StorageTab(QWidget):
         if not self.parent or not hasattr(self.parent, "models_db"):
             return
             
-        # Clear table
-        self.models_table.setRowCount(0)
-        
-        # Get models from database
+        # Get models from database; the table model reads the records directly
         models = self.parent.models_db.list_models()
-        
-        # Add rows
-        for i, model in enumerate(models):
-            self.models_table.insertRow(i)
-            
-            # Model name
-            name_item = QTableWidgetItem(model.get("name", "Unknown"))
-            name_item.setData(Qt.UserRole, model.get("id"))
-            self.models_table.setItem(i, 0, name_item)
-            
-            # Model type
-            type_item = QTableWidgetItem(model.get("type", "Unknown"))
-            self.models_table.setItem(i, 1, type_item)
-            
-            # Model size
-            from src.utils.formatting import format_size
-            size = model.get("size", 0)
-            size_item = QTableWidgetItem(format_size(size))
-            size_item.setData(Qt.UserRole, size)  # Store raw size for sorting
-            self.models_table.setItem(i, 2, size_item)
-            
-            # Base model
-            base_model_item = QTableWidgetItem(model.get("base_model", "Unknown"))
-            self.models_table.setItem(i, 3, base_model_item)
-            
-            # Actions cell
-            actions_cell = QWidget()
-            actions_layout = QHBoxLayout(actions_cell)
-            actions_layout.setContentsMargins(2, 2, 2, 2)
-            
-            # Delete button
-            delete_btn = QPushButton("🗑️")
-            delete_btn.setToolTip("Delete")
-            delete_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: transparent;
-                    color: {self.theme['text_secondary']};
-                    border: none;
-                }}
-                QPushButton:hover {{
-                    color: {self.theme['danger']};
-                }}
-            """)
-            delete_btn.clicked.connect(lambda _, mid=model.get("id"): self.delete_model(mid))
-            
-            # View button
-            view_btn = QPushButton("👁️")
-            view_btn.setToolTip("View Details")
-            view_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: transparent;
-                    color: {self.theme['text_secondary']};
-                    border: none;
-                }}
-                QPushButton:hover {{
-                    color: {self.theme['accent']};
-                }}
-            """)
-            view_btn.clicked.connect(lambda _, m=model: self.view_model_details(m))
-            
-            # Add buttons to layout
-            actions_layout.addWidget(view_btn)
-            actions_layout.addWidget(delete_btn)
-            actions_layout.addStretch()
-            
-            # Set cell widget
-            self.models_table.setCellWidget(i, 4, actions_cell)
+        self.models_model.set_models(models)
+        
+        # Add action buttons to each row with one repaint at the end
+        self.models_table.setUpdatesEnabled(False)
+        try:
+            for i, model in enumerate(models):
+                # Actions cell
+                actions_cell = QWidget()
+                actions_layout = QHBoxLayout(actions_cell)
+                actions_layout.setContentsMargins(2, 2, 2, 2)
+                
+                # Delete button
+                delete_btn = QPushButton("🗑️")
+                delete_btn.setToolTip("Delete")
+                delete_btn.setObjectName("storageRowDeleteButton")
+                delete_btn.clicked.connect(lambda _, mid=model.get("id"): self.delete_model(mid))
+                
+                # View button
+                view_btn = QPushButton("👁️")
+                view_btn.setToolTip("View Details")
+                view_btn.setObjectName("storageRowViewButton")
+                view_btn.clicked.connect(lambda _, m=model: self.view_model_details(m))
+                
+                # Add buttons to layout
+                actions_layout.addWidget(view_btn)
+                actions_layout.addWidget(delete_btn)
+                actions_layout.addStretch()
+                
+                # Set cell widget
+                self.models_table.setIndexWidget(self.models_model.index(i, 4), actions_cell)
+        finally:
+            self.models_table.setUpdatesEnabled(True)
     
     def delete_model(self, model_id):
         """Delete a single model"""
@@ -409,7 +457,7 @@ class StorageTab(QWidget):
             deleted_count = 0
             
             for row in selected_rows:
-                model_id = self.models_table.item(row.row(), 0).data(Qt.UserRole)
+                model_id = self.models_model.model_id(row.row())
                 model_data = self.parent.models_db.get_model(model_id)
                 
                 # Delete model
@@ -455,7 +503,7 @@ class StorageTab(QWidget):
         # Export models
         model_paths = []
         for row in selected_rows:
-            model_id = self.models_table.item(row.row(), 0).data(Qt.UserRole)
+            model_id = self.models_model.model_id(row.row())
             model_data = self.parent.models_db.get_model(model_id)
             
             # Get path
@@ -533,108 +581,11 @@ class StorageTab(QWidget):
         # Update storage info widget
         self.storage_info_widget.set_theme(theme)
         
-        # Update chart colors
-        self.chart_widget.setBackground(theme["secondary"])
+        # Update chart colors and refresh the pie chart, if it has been built
+        if self.chart_widget is not None:
+            self.chart_widget.setBackground(theme["secondary"])
+            total, free, categories = self.parent.storage_manager.get_storage_usage()
+            self.update_pie_chart(categories)
         
-        # Refresh pie chart
-        total, free, categories = self.parent.storage_manager.get_storage_usage()
-        self.update_pie_chart(categories)
-        
-        # Update table styles
-        self.models_table.setStyleSheet(f"""
-            QTableWidget {{
-                background-color: {self.theme['secondary']};
-                gridline-color: {self.theme['border']};
-                color: {self.theme['text']};
-                border: none;
-            }}
-            QTableWidget::item {{
-                padding: 4px;
-            }}
-            QTableWidget::item:selected {{
-                background-color: {self.theme['accent']};
-                color: white;
-            }}
-            QHeaderView::section {{
-                background-color: {self.theme['card']};
-                color: {self.theme['text']};
-                padding: 6px;
-                border: 1px solid {self.theme['border']};
-            }}
-        """)
-        
-        # Update buttons
-        self.delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['danger']};
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['danger_hover']};
-            }}
-        """)
-        
-        self.export_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['accent']};
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['accent_hover']};
-            }}
-        """)
-        
-        self.find_duplicates_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['secondary']};
-                color: {self.theme['text']};
-                border: 1px solid {self.theme['border']};
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['card_hover']};
-            }}
-        """)
-        
-        self.scan_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['info']};
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme['accent_hover']};
-            }}
-        """)
-        
-        # Update tabs
-        self.tabs.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border: 1px solid {self.theme['border']};
-                background: {self.theme['secondary']};
-            }}
-            QTabBar::tab {{
-                background: {self.theme['secondary']};
-                color: {self.theme['text_secondary']};
-                padding: 8px 16px;
-                border: 1px solid {self.theme['border']};
-                margin-right: 2px;
-            }}
-            QTabBar::tab:selected {{
-                background: {self.theme['primary']};
-                color: {self.theme['text']};
-                border-bottom-color: {self.theme['primary']};
-            }}
-            QTabBar::tab:hover:!selected {{
-                background: {self.theme['card_hover']};
-            }}
-        """)
+        # Every widget in the tab is styled by the tab's cached stylesheet
+        self.setStyleSheet(_stylesheet(theme))
@@ -1,10 +1,12 @@
 
 import re
 import os
+from functools import lru_cache
 from typing import Dict, List, Union
 from datetime import datetime, timedelta
 
 
+@lru_cache(maxsize=1024)
 def format_size(size_bytes: Union[int, float]) -> str:
     """Format file size in bytes to human readable format
     
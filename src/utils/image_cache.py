@@ -0,0 +1,82 @@
+import hashlib
+import os
+
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader
+
+from src.constants.application import CACHE_DIR
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Scaled copies of images are persisted here, outside the model folders
+THUMBNAIL_CACHE_DIR = CACHE_DIR / "thumbnails"
+
+# JPEG quality of the persisted scaled copies
+THUMBNAIL_CACHE_QUALITY = 85
+
+
+def load_cached_pixmap(path: str) -> QPixmap:
+    """Load an image once and share the decoded pixmap through QPixmapCache"""
+    pixmap = QPixmapCache.find(path)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(path)
+        if not pixmap.isNull():
+            QPixmapCache.insert(path, pixmap)
+    return pixmap
+
+
+def thumbnail_cache_key(path: str, bound: QSize) -> str:
+    """Get the QPixmapCache key of an image decoded to fit bound"""
+    return f"{path}@{bound.width()}x{bound.height()}"
+
+
+def thumbnail_cache_path(path: str, bound: QSize) -> str:
+    """Get the disk cache file of an image decoded to fit bound"""
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+    return str(THUMBNAIL_CACHE_DIR / f"{digest}_{bound.width()}x{bound.height()}.jpg")
+
+
+def decode_scaled_image(path: str, bound: QSize) -> QImage:
+    """Decode an image at a size fitting bound, using and filling the disk cache
+
+    Only touches QImage, so it is safe to run off the GUI thread.
+    """
+    # A scaled copy saved by an earlier run is a far smaller decode than the source
+    thumb_path = thumbnail_cache_path(path, bound)
+    try:
+        if os.path.getmtime(thumb_path) >= os.path.getmtime(path):
+            image = QImage(thumb_path)
+            if not image.isNull():
+                return image
+    except OSError:
+        pass
+    
+    # Let the codec decode at the reduced size instead of scaling a full decode
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    scaled = size.isValid() and (size.width() > bound.width() or size.height() > bound.height())
+    if scaled:
+        size.scale(bound, Qt.KeepAspectRatio)
+        reader.setScaledSize(size)
+    
+    image = reader.read()
+    
+    # Persist the scaled copy; JPEG has no alpha, so transparent images are skipped
+    if scaled and not image.isNull() and not image.hasAlphaChannel():
+        try:
+            os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+            if not image.save(thumb_path, "JPEG", THUMBNAIL_CACHE_QUALITY):
+                logger.debug(f"Could not write thumbnail cache: {thumb_path}")
+        except Exception as e:
+            logger.debug(f"Error writing thumbnail cache: {str(e)}")
+    
+    return image
+
+
+def fit_pixmap(pixmap: QPixmap, target: QSize, transform) -> QPixmap:
+    """Scale a pixmap to fit target, skipping the resample when it already fits exactly"""
+    if pixmap.size().scaled(target, Qt.KeepAspectRatio) == pixmap.size():
+        return pixmap
+    return pixmap.scaled(target, Qt.KeepAspectRatio, transform)